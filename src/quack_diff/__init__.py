@@ -1,8 +1,8 @@
 __version__ = "0.0.10"
 __author__ = "Matteo Renoldi"
 
-from quack_diff.core.connector import DuckDBConnector
-from quack_diff.core.differ import DataDiffer
+from typing import TYPE_CHECKING, Any
+
 from quack_diff.core.sql_utils import (
     AttachError,
     DatabaseError,
@@ -13,6 +13,17 @@ from quack_diff.core.sql_utils import (
     TableNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from quack_diff.core.connector import DuckDBConnector
+    from quack_diff.core.differ import DataDiffer
+
+# Exports resolved on first access so that importing the package (e.g. for
+# the CLI's --help or --dry-run) does not pull in DuckDB
+_LAZY_EXPORTS = {
+    "DuckDBConnector": "quack_diff.core.connector",
+    "DataDiffer": "quack_diff.core.differ",
+}
+
 __all__ = [
     "AttachError",
     "DatabaseError",
@@ -25,3 +36,15 @@ __all__ = [
     "TableNotFoundError",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
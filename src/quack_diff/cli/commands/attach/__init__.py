@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
@@ -22,9 +22,54 @@ from quack_diff.cli.output import (
     print_json,
 )
 from quack_diff.config import get_settings
-from quack_diff.core.connector import DuckDBConnector
 from quack_diff.core.sql_utils import AttachError, QueryExecutionError, SQLInjectionError
 
+if TYPE_CHECKING:
+    from quack_diff.core.connector import DuckDBConnector
+
+# Default number of tables shown by `attach` on the console; --json output
+# lists every table unless --max-tables is given
+DEFAULT_MAX_TABLES = 200
+
+
+def _list_tables(
+    connector: DuckDBConnector,
+    name: str,
+    all_catalogs: bool = False,
+    limit: int | None = None,
+) -> list[str]:
+    """List the tables of an attached database.
+
+    Queries ``duckdb_tables()`` filtered by database name instead of
+    ``SHOW TABLES``, which enumerates every attached catalog.
+
+    Args:
+        connector: DuckDB connector with the database already attached
+        name: Alias of the attached database
+        all_catalogs: List tables across all attached catalogs
+        limit: Maximum number of rows to fetch (pushed down as SQL LIMIT)
+
+    Returns:
+        Sorted list of table names (qualified as ``database.schema.table``
+        when ``all_catalogs`` is set)
+    """
+    limit_clause = " LIMIT ?" if limit is not None else ""
+    limit_params = [limit] if limit is not None else []
+
+    if all_catalogs:
+        rows = connector.execute_iter(
+            "SELECT database_name || '.' || schema_name || '.' || table_name "
+            f"FROM duckdb_tables() ORDER BY database_name, schema_name, table_name{limit_clause}",
+            limit_params,
+        )
+        return [row[0] for row in rows]
+
+    rows = connector.execute_iter(
+        f"SELECT table_name FROM duckdb_tables() WHERE database_name = ? ORDER BY table_name{limit_clause}",
+        [name, *limit_params],
+    )
+    return [row[0] for row in rows]
+
 
 def attach(
     name: Annotated[
@@ -53,6 +98,21 @@ def attach(
             help="Output results as JSON for CI/CD integration",
         ),
     ] = False,
+    all_catalogs: Annotated[
+        bool,
+        typer.Option(
+            "--all-catalogs",
+            help="List tables from every attached catalog, not just this database",
+        ),
+    ] = False,
+    max_tables: Annotated[
+        int | None,
+        typer.Option(
+            "--max-tables",
+            min=0,
+            help=f"Maximum number of tables to list (0 = no limit; default {DEFAULT_MAX_TABLES}, no limit with --json)",
+        ),
+    ] = None,
 ) -> None:
     """Attach a DuckDB database and list its tables.
 
@@ -75,9 +135,15 @@ def attach(
     if json_output:
         set_json_output_mode(True)
 
+    if max_tables is None:
+        max_tables = 0 if json_output else DEFAULT_MAX_TABLES
+
     start_time = time.time()
 
     try:
+        # Deferred so importing the CLI (e.g. for --help) skips DuckDB
+        from quack_diff.core.connector import DuckDBConnector
+
         settings = get_settings(config_file=config_file)
 
         with DuckDBConnector(settings=settings) as connector:
@@ -86,9 +152,14 @@ def attach(
 
             # List tables
             tables: list[str] = []
+            truncated = False
             try:
-                result = connector.execute_fetchall(f"SHOW TABLES IN {name}")
-                tables = [row[0] for row in result] if result else []
+                # Fetch one extra row to detect whether the listing was truncated
+                limit = max_tables + 1 if max_tables else None
+                tables = _list_tables(connector, name, all_catalogs=all_catalogs, limit=limit)
+                if max_tables and len(tables) > max_tables:
+                    tables = tables[:max_tables]
+                    truncated = True
             except QueryExecutionError as e:
                 if not json_output:
                     console.print(f"\n[yellow]Warning: Could not list tables: {e.message}[/yellow]")
@@ -101,6 +172,7 @@ def attach(
                     alias=name,
                     path=path,
                     tables=tables,
+                    truncated=truncated,
                     duration_seconds=duration,
                 )
                 print_json(json_data)
@@ -109,8 +181,13 @@ def attach(
 
                 if tables:
                     console.print("\n[bold]Tables:[/bold]")
-                    for table in tables:
-                        console.print(f"  - {table}")
+                    # Render the listing in one call; table names are not markup
+                    console.print("\n".join(f"  - {table}" for table in tables), markup=False)
+                    if truncated:
+                        console.print(
+                            f"  [muted]... more tables not shown (showing first {max_tables}, "
+                            "use --max-tables 0 to show all)[/muted]"
+                        )
                 else:
                     console.print("\n[muted]No tables found[/muted]")
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+import re
 import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 
@@ -17,90 +20,157 @@ from quack_diff.cli.console import (
     set_json_output_mode,
     status_context,
 )
-from quack_diff.cli.errors import get_error_info
-from quack_diff.cli.formatters import (
-    SnowflakeConnectionInfo,
-    print_diff_result,
-    print_snowflake_connections,
-)
+from quack_diff.cli.errors import error_prefix, get_error_info
 from quack_diff.cli.output import (
     format_diff_result_json,
     format_error_json,
     print_json,
 )
-from quack_diff.config import get_settings
-from quack_diff.core.connector import DuckDBConnector
-from quack_diff.core.differ import DataDiffer
-from quack_diff.core.sql_utils import (
-    AttachError,
-    DatabaseError,
-    KeyColumnError,
-    QueryExecutionError,
-    SchemaError,
-    SQLInjectionError,
-    TableNotFoundError,
-)
+from quack_diff.config import SnowflakeConfig, get_settings, get_snowflake_config
+from quack_diff.core.sql_utils import SQLInjectionError
 
 if TYPE_CHECKING:
+    from quack_diff.cli.formatters import SnowflakeConnectionInfo
     from quack_diff.config import Settings
+    from quack_diff.core.connector import DuckDBConnector
 
 logger = logging.getLogger(__name__)
 
+# Alias prefix of a table reference: an explicit Snowflake prefix or any
+# short alphabetic first part (e.g. "sf.SCHEMA.TABLE", "prod.users")
+_TABLE_REF_RE = re.compile(r"^(?P<alias>(?i:snowflake)|[A-Za-z]{1,4})\.(?P<rest>.*)$", re.DOTALL)
+_SF_PREFIXES = frozenset({"sf", "snowflake"})
+
+# Database types from the ``databases`` config
+_DB_TYPE_SNOWFLAKE = "snowflake"
+_DB_TYPE_DUCKDB = "duckdb"
+
+# File extensions that mark a reference as a path rather than an aliased table
+_FILE_SUFFIXES = (".parquet", ".csv", ".json", ".duckdb")
+
+# Relative time-travel values look like "5 minutes ago"
+_AGO_RE = re.compile(r"\bago\b", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class TableRef:
+    """Parsed and classified ``--source``/``--target`` reference.
+
+    Built once per endpoint by :func:`_classify_table` and reused for
+    auto-attach, the Snowflake pull and the dry-run plan.
+    """
+
+    raw: str
+    alias: str | None
+    table: str
+    is_snowflake: bool
+    db_config: dict[str, Any] | None
+
 
+@lru_cache(maxsize=256)
 def _parse_table_reference(table: str) -> tuple[str | None, str]:
     """Parse a table reference to extract alias and table name.
 
+    A leading ``sf.``/``snowflake.`` prefix, or any short (1-4 letter) first
+    part, is treated as a database alias. File paths (containing a path
+    separator or ending in a known data file extension, in any case) never
+    carry an alias. Results are memoized because the same source/target
+    strings are parsed several times per comparison.
+
     Args:
         table: Table reference (e.g., "sf.SCHEMA.TABLE" or "SCHEMA.TABLE")
 
     Returns:
         Tuple of (alias, table_name). Alias is None if not present.
     """
-    parts = table.split(".", 1)
-    if len(parts) == 2 and parts[0].lower() in ("sf", "snowflake"):
-        # Has a recognized alias prefix
-        return parts[0].lower(), parts[1]
+    if "/" in table or "\\" in table or table.lower().endswith(_FILE_SUFFIXES):
+        return None, table
 
-    # Check if first part is a configured database alias
-    # For now, just check common patterns
-    if len(parts) >= 2:
-        first_part = parts[0].lower()
-        # Return as potential alias if it's short (likely an alias)
-        if len(first_part) <= 4 and first_part.isalpha():
-            return first_part, ".".join(parts[1:])
+    match = _TABLE_REF_RE.match(table)
+    if match is None:
+        return None, table
+    alias = match.group("alias")
+    # Aliases are almost always written in lowercase; only copy when needed
+    if not alias.islower():
+        alias = alias.lower()
+    return alias, match.group("rest")
 
-    return None, table
 
+def _parse_columns(columns: list[str] | None) -> list[str] | None:
+    """Flatten --columns values into a single list of column names.
 
-def _is_snowflake_table(table: str, settings: Settings) -> bool:
-    """Check if a table reference points to a Snowflake table.
+    Supports both ``-c a,b`` and ``-c a -c b``; empty entries are dropped.
 
     Args:
-        table: Table reference
-        settings: Application settings
+        columns: Raw --columns values
 
     Returns:
-        True if this is a Snowflake table
+        Column names, or None to compare all common columns
     """
-    alias, _ = _parse_table_reference(table)
+    if not columns:
+        return None
+    column_list: list[str] = []
+    for value in columns:
+        column_list.extend(col for c in value.split(",") if (col := c.strip()))
+    return column_list or None
+
 
-    # Check explicit sf/snowflake prefix
-    if alias in ("sf", "snowflake"):
-        return True
+def _split_time_travel(at: str | None) -> tuple[str | None, str | None]:
+    """Split a --source-at/--target-at value into timestamp or offset.
 
-    # Check if alias is configured as snowflake in databases config
-    if alias and alias in settings.databases:
-        db_config = settings.databases[alias]
-        return db_config.get("type", "snowflake").lower() == "snowflake"
+    Args:
+        at: Time-travel value (e.g., "5 minutes ago" or "2024-01-15 10:30:00")
 
-    return False
+    Returns:
+        Tuple of (timestamp, offset); at most one of them is set
+    """
+    if not at:
+        return None, None
+    return (None, at) if _AGO_RE.search(at) else (at, None)
+
+
+def _is_db_type(db_type: str, expected: str) -> bool:
+    """Case-insensitively compare a configured database type.
+
+    Args:
+        db_type: ``type`` value from a ``databases`` entry
+        expected: Lowercase type to compare against
+
+    Returns:
+        True if the types match
+    """
+    return db_type == expected or db_type.casefold() == expected
+
+
+def _classify_table(table: str, settings: Settings) -> TableRef:
+    """Parse and classify a compare endpoint in a single pass.
+
+    Args:
+        table: Raw table reference from ``--source``/``--target``
+        settings: Application settings (used for alias resolution)
+
+    Returns:
+        TableRef with the alias, table name and Snowflake flag resolved
+    """
+    alias, table_name = _parse_table_reference(table)
+    if alias is None:
+        return TableRef(raw=table, alias=None, table=table_name, is_snowflake=False, db_config=None)
+
+    db_config = settings.databases.get(alias) if settings.databases else None
+    if alias in _SF_PREFIXES:
+        is_snowflake = True
+    elif db_config is not None:
+        is_snowflake = _is_db_type(db_config.get("type", _DB_TYPE_SNOWFLAKE), _DB_TYPE_SNOWFLAKE)
+    else:
+        is_snowflake = False
+
+    return TableRef(raw=table, alias=alias, table=table_name, is_snowflake=is_snowflake, db_config=db_config)
 
 
 def _auto_attach_databases(
     connector: DuckDBConnector,
-    settings: Settings,
-    source: str,
-    target: str,
+    source_ref: TableRef,
+    target_ref: TableRef,
     verbose: bool = False,
 ) -> None:
     """Auto-attach DuckDB databases based on config and table references.
@@ -113,48 +183,141 @@ def _auto_attach_databases(
 
     Args:
         connector: DuckDB connector
-        settings: Application settings
-        source: Source table reference
-        target: Target table reference
+        source_ref: Classified source table reference
+        target_ref: Classified target table reference
         verbose: Enable verbose output
     """
-    # Collect unique aliases from table references
-    aliases_to_attach: set[str] = set()
+    # At most two references; when both share an alias only check it once
+    refs = (source_ref,) if source_ref.alias == target_ref.alias else (source_ref, target_ref)
+    refs_to_attach = tuple(ref for ref in refs if ref.alias and not ref.is_snowflake and ref.db_config is not None)
 
-    for table in (source, target):
-        alias, _ = _parse_table_reference(table)
-        if alias:
-            aliases_to_attach.add(alias)
+    if not refs_to_attach:
+        return
 
     # Attach each database
-    for alias in aliases_to_attach:
-        if alias in connector.attached_databases:
+    for ref in refs_to_attach:
+        alias, db_config = ref.alias, ref.db_config
+        if connector.is_attached(alias):
             logger.debug(f"Database '{alias}' already attached")
             continue
 
-        # Check if alias is in databases config
-        if alias in settings.databases:
-            db_config = settings.databases[alias]
-            db_type = db_config.get("type", "duckdb").lower()
+        if _is_db_type(db_config.get("type", _DB_TYPE_DUCKDB), _DB_TYPE_DUCKDB):
+            path = db_config.get("path")
+            if path:
+                if verbose:
+                    print_info(f"Attaching DuckDB database: {path} as '{alias}'")
+                connector.attach_duckdb(alias, str(path))
+
+
+def _resolve_sf_connection(ref: TableRef, settings: Settings) -> tuple[SnowflakeConfig, str | None, str | None]:
+    """Resolve the Snowflake config and overrides for a table reference.
+
+    Args:
+        ref: Classified Snowflake table reference
+        settings: Application settings
+
+    Returns:
+        Tuple of (config, database_override, connection_name); the config
+        falls back to ``settings.snowflake`` when the alias has no profile
+    """
+    db_config = ref.db_config
+    if db_config is None:
+        return settings.snowflake, None, None
+
+    connection_name = db_config.get("connection_name")
+    config = get_snowflake_config(connection_name) if connection_name else settings.snowflake
+    return config, db_config.get("database"), connection_name
+
+
+def _pull_one(
+    connector: DuckDBConnector,
+    settings: Settings,
+    side: str,
+    ref: TableRef,
+    local_name: str,
+    timestamp: str | None = None,
+    offset: str | None = None,
+    collect_connection_info: bool = True,
+) -> tuple[str, SnowflakeConnectionInfo | None]:
+    """Pull one side of the comparison from Snowflake.
+
+    Args:
+        connector: DuckDB connector
+        settings: Application settings
+        side: Which side is pulled ("source" or "target")
+        ref: Classified Snowflake table reference
+        local_name: Local DuckDB table name to load the data into
+        timestamp: Time-travel timestamp
+        offset: Time-travel offset
+        collect_connection_info: Build connection details for display
 
-            if db_type == "duckdb":
-                path = db_config.get("path")
-                if path:
-                    if verbose:
-                        print_info(f"Attaching DuckDB database: {path} as '{alias}'")
-                    connector.attach_duckdb(alias, str(path))
+    Returns:
+        Tuple of (local_name, connection_info); connection_info is None when
+        not collected
+    """
+    table_name = ref.table
+    config, database, connection_name = _resolve_sf_connection(ref, settings)
+
+    connector.pull_snowflake_table(
+        table_name=table_name,
+        local_name=local_name,
+        timestamp=timestamp,
+        offset=offset,
+        config=config,
+        database=database,
+    )
+
+    if not collect_connection_info:
+        return local_name, None
+
+    from quack_diff.cli.formatters import SnowflakeConnectionInfo
+
+    # Collect connection info for display
+    connection_info = SnowflakeConnectionInfo(
+        alias=side,
+        table_name=table_name,
+        account=config.account,
+        user=config.user,
+        database=database or config.database,
+        schema=config.schema_name,
+        warehouse=config.warehouse,
+        role=config.role,
+        authenticator=config.authenticator,
+        connection_name=connection_name or config.connection_name,
+    )
+    return local_name, connection_info
+
+
+def _describe_snowflake_pulls(*endpoints: tuple[TableRef, str | None, str | None]) -> str:
+    """Describe the Snowflake pulls for the given endpoints in one message.
+
+    Args:
+        *endpoints: (ref, timestamp, offset) per endpoint; non-Snowflake
+            refs are skipped
+
+    Returns:
+        One "Pulling Snowflake table" line per Snowflake endpoint
+    """
+    lines = []
+    for ref, timestamp, offset in endpoints:
+        if not ref.is_snowflake:
+            continue
+        time_travel = timestamp or offset
+        suffix = f" AT {time_travel}" if time_travel else ""
+        lines.append(f"Pulling Snowflake table: {ref.table}{suffix}")
+    return "\n".join(lines)
 
 
 def _pull_snowflake_tables(
     connector: DuckDBConnector,
     settings: Settings,
-    source: str,
-    target: str,
+    source_ref: TableRef,
+    target_ref: TableRef,
     source_timestamp: str | None = None,
     source_offset: str | None = None,
     target_timestamp: str | None = None,
     target_offset: str | None = None,
-    verbose: bool = False,
+    collect_connection_info: bool = True,
 ) -> tuple[str, str, list[SnowflakeConnectionInfo]]:
     """Pull Snowflake tables into local DuckDB tables using native connector.
 
@@ -163,131 +326,77 @@ def _pull_snowflake_tables(
     - Better compatibility (avoids virtual column errors)
     - No dependency on ADBC driver
 
+    When both sides are Snowflake tables they are pulled concurrently, since
+    the pulls are independent and dominated by network I/O. When both sides
+    are the same table at the same point in time, it is pulled only once
+    and compared against itself.
+
     Args:
         connector: DuckDB connector
         settings: Application settings
-        source: Source table reference
-        target: Target table reference
+        source_ref: Classified source table reference
+        target_ref: Classified target table reference
         source_timestamp: Time-travel timestamp for source
         source_offset: Time-travel offset for source
         target_timestamp: Time-travel timestamp for target
         target_offset: Time-travel offset for target
-        verbose: Enable verbose output
+        collect_connection_info: Build connection details for display (the
+            returned list is empty otherwise)
 
     Returns:
         Tuple of (source_local_name, target_local_name, connection_info_list)
     """
-    source_local = "__source_pulled"
-    target_local = "__target_pulled"
-    connection_infos: list[SnowflakeConnectionInfo] = []
-
-    # Pull source table
-    source_alias, source_table = _parse_table_reference(source)
-    if source_alias and _is_snowflake_table(source, settings):
-        if verbose:
-            time_travel = ""
-            if source_timestamp:
-                time_travel = f" AT {source_timestamp}"
-            elif source_offset:
-                time_travel = f" AT {source_offset}"
-            print_info(f"Pulling Snowflake table: {source_table}{time_travel}")
-
-        # Get connection config and database override
-        config = None
-        source_database = None
-        source_connection_name = None
-        if source_alias in settings.databases:
-            db_config = settings.databases[source_alias]
-            source_connection_name = db_config.get("connection_name")
-            source_database = db_config.get("database")
-            if source_connection_name:
-                from quack_diff.config import SnowflakeConfig
-
-                config = SnowflakeConfig(connection_name=source_connection_name)
-        if config is None:
-            config = settings.snowflake
-
-        connector.pull_snowflake_table(
-            table_name=source_table,
-            local_name=source_local,
-            timestamp=source_timestamp,
-            offset=source_offset,
-            config=config,
-            database=source_database,
-        )
-
-        # Collect connection info for display
-        connection_infos.append(
-            SnowflakeConnectionInfo(
-                alias="source",
-                table_name=source_table,
-                account=config.account,
-                user=config.user,
-                database=source_database or config.database,
-                schema=config.schema_name,
-                warehouse=config.warehouse,
-                role=config.role,
-                authenticator=config.authenticator,
-                connection_name=source_connection_name or config.connection_name,
-            )
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Same table at the same point in time: one pull serves both sides
+    if (
+        source_ref.is_snowflake
+        and target_ref.is_snowflake
+        and (source_ref.alias, source_ref.table, source_timestamp, source_offset)
+        == (target_ref.alias, target_ref.table, target_timestamp, target_offset)
+    ):
+        local_name, connection_info = _pull_one(
+            connector,
+            settings,
+            "source",
+            source_ref,
+            "__source_pulled",
+            source_timestamp,
+            source_offset,
+            collect_connection_info,
         )
+        if connection_info is None:
+            return local_name, local_name, []
+        return local_name, local_name, [connection_info, replace(connection_info, alias="target")]
+
+    endpoints = (
+        ("source", source_ref, "__source_pulled", source_timestamp, source_offset),
+        ("target", target_ref, "__target_pulled", target_timestamp, target_offset),
+    )
+
+    # Non-Snowflake sides are compared in place under their original reference
+    locals_by_side = {side: ref.raw for side, ref, *_ in endpoints}
+    pulls = [
+        (connector, settings, side, ref, local_name, timestamp, offset, collect_connection_info)
+        for side, ref, local_name, timestamp, offset in endpoints
+        if ref.is_snowflake
+    ]
+
+    if len(pulls) > 1:
+        # map() yields in submission order, so source stays ahead of target
+        # even when the target pull completes first
+        with ThreadPoolExecutor(max_workers=len(pulls)) as executor:
+            results = list(executor.map(lambda args: _pull_one(*args), pulls))
     else:
-        source_local = source
-
-    # Pull target table
-    target_alias, target_table = _parse_table_reference(target)
-    if target_alias and _is_snowflake_table(target, settings):
-        if verbose:
-            time_travel = ""
-            if target_timestamp:
-                time_travel = f" AT {target_timestamp}"
-            elif target_offset:
-                time_travel = f" AT {target_offset}"
-            print_info(f"Pulling Snowflake table: {target_table}{time_travel}")
-
-        # Get connection config and database override
-        config = None
-        target_database = None
-        target_connection_name = None
-        if target_alias in settings.databases:
-            db_config = settings.databases[target_alias]
-            target_connection_name = db_config.get("connection_name")
-            target_database = db_config.get("database")
-            if target_connection_name:
-                from quack_diff.config import SnowflakeConfig
-
-                config = SnowflakeConfig(connection_name=target_connection_name)
-        if config is None:
-            config = settings.snowflake
-
-        connector.pull_snowflake_table(
-            table_name=target_table,
-            local_name=target_local,
-            timestamp=target_timestamp,
-            offset=target_offset,
-            config=config,
-            database=target_database,
-        )
+        results = [_pull_one(*args) for args in pulls]
 
-        # Collect connection info for display
-        connection_infos.append(
-            SnowflakeConnectionInfo(
-                alias="target",
-                table_name=target_table,
-                account=config.account,
-                user=config.user,
-                database=target_database or config.database,
-                schema=config.schema_name,
-                warehouse=config.warehouse,
-                role=config.role,
-                authenticator=config.authenticator,
-                connection_name=target_connection_name or config.connection_name,
-            )
-        )
-    else:
-        target_local = target
+    connection_infos: list[SnowflakeConnectionInfo] = []
+    for (_, _, side, *_), (local_name, connection_info) in zip(pulls, results, strict=True):
+        locals_by_side[side] = local_name
+        if connection_info is not None:
+            connection_infos.append(connection_info)
 
-    return source_local, target_local, connection_infos
+    return locals_by_side["source"], locals_by_side["target"], connection_infos
 
 
 def compare(
@@ -316,11 +425,11 @@ def compare(
         ),
     ],
     columns: Annotated[
-        str | None,
+        list[str] | None,
         typer.Option(
             "--columns",
             "-c",
-            help="Comma-separated list of columns to compare (default: all common columns)",
+            help="Columns to compare, comma-separated or repeated (default: all common columns)",
         ),
     ] = None,
     source_at: Annotated[
@@ -417,36 +526,23 @@ def compare(
     if json_output:
         set_json_output_mode(True)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Load settings
         settings = get_settings(config_file=config_file)
 
         # Parse columns if provided
-        column_list = None
-        if columns:
-            column_list = [c.strip() for c in columns.split(",")]
+        column_list = _parse_columns(columns)
 
         # Parse time-travel options
-        source_offset = None
-        source_timestamp = None
-        if source_at:
-            if "ago" in source_at.lower():
-                source_offset = source_at
-            else:
-                source_timestamp = source_at
-
-        target_offset = None
-        target_timestamp = None
-        if target_at:
-            if "ago" in target_at.lower():
-                target_offset = target_at
-            else:
-                target_timestamp = target_at
+        source_timestamp, source_offset = _split_time_travel(source_at)
+        target_timestamp, target_offset = _split_time_travel(target_at)
 
-        # Check if we need to use the Snowflake pull approach
-        use_snowflake_pull = _is_snowflake_table(source, settings) or _is_snowflake_table(target, settings)
+        # Parse and classify both endpoints once; the refs are reused below
+        source_ref = _classify_table(source, settings)
+        target_ref = _classify_table(target, settings)
+        use_snowflake_pull = source_ref.is_snowflake or target_ref.is_snowflake
 
         # Handle dry-run mode
         if dry_run:
@@ -459,11 +555,17 @@ def compare(
                 target_at=target_at,
                 threshold=threshold,
                 limit=limit,
-                use_snowflake_pull=use_snowflake_pull,
+                source_is_sf=source_ref.is_snowflake,
+                target_is_sf=target_ref.is_snowflake,
                 json_output=json_output,
             )
             raise typer.Exit(0)
 
+        # Deferred so --help and --dry-run skip the connector/differ/formatter imports
+        from quack_diff.cli.formatters import print_diff_result, print_snowflake_connections
+        from quack_diff.core.connector import DuckDBConnector
+        from quack_diff.core.differ import DataDiffer
+
         # Create connector and differ
         with DuckDBConnector(settings=settings) as connector:
             differ = DataDiffer(
@@ -478,18 +580,27 @@ def compare(
             # Determine table names to compare
             snowflake_connections: list[SnowflakeConnectionInfo] = []
             if use_snowflake_pull:
+                # Announce all pulls up front so nothing prints under the spinner
+                if verbose:
+                    print_info(
+                        _describe_snowflake_pulls(
+                            (source_ref, source_timestamp, source_offset),
+                            (target_ref, target_timestamp, target_offset),
+                        )
+                    )
+
                 # Use native Snowflake connector for pulling data (supports time-travel)
                 with status_context("Pulling data from Snowflake..."):
                     source_table_name, target_table_name, snowflake_connections = _pull_snowflake_tables(
                         connector=connector,
                         settings=settings,
-                        source=source,
-                        target=target,
+                        source_ref=source_ref,
+                        target_ref=target_ref,
                         source_timestamp=source_timestamp,
                         source_offset=source_offset,
                         target_timestamp=target_timestamp,
                         target_offset=target_offset,
-                        verbose=verbose,
+                        collect_connection_info=verbose,
                     )
                 # Time-travel already applied during pull, so don't pass to diff
                 source_timestamp = None
@@ -502,7 +613,7 @@ def compare(
                     print_snowflake_connections(snowflake_connections)
             else:
                 # Auto-attach databases for non-Snowflake tables
-                _auto_attach_databases(connector, settings, source, target, verbose)
+                _auto_attach_databases(connector, source_ref, target_ref, verbose)
                 source_table_name = source
                 target_table_name = target
 
@@ -521,7 +632,7 @@ def compare(
                     limit=limit,
                 )
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Output results based on format
             if json_output:
@@ -566,24 +677,8 @@ def compare(
 
     except typer.Exit:
         raise
-    except TableNotFoundError as e:
-        _handle_error(e, "Table not found", verbose, json_output, start_time)
-    except KeyColumnError as e:
-        _handle_error(e, "Key column error", verbose, json_output, start_time)
-    except SchemaError as e:
-        _handle_error(e, "Schema error", verbose, json_output, start_time)
-    except AttachError as e:
-        _handle_error(e, "Database attach error", verbose, json_output, start_time)
-    except QueryExecutionError as e:
-        _handle_error(e, "Query execution error", verbose, json_output, start_time)
-    except SQLInjectionError as e:
-        _handle_error(e, "Invalid input", verbose, json_output, start_time)
-    except DatabaseError as e:
-        _handle_error(e, "Database error", verbose, json_output, start_time)
-    except ValueError as e:
-        _handle_error(e, "Invalid value", verbose, json_output, start_time)
     except Exception as e:
-        _handle_error(e, "Unexpected error", verbose, json_output, start_time)
+        _handle_error(e, error_prefix(e), verbose, json_output, start_time)
 
 
 def _print_dry_run_info(
@@ -595,7 +690,8 @@ def _print_dry_run_info(
     target_at: str | None,
     threshold: float,
     limit: int | None,
-    use_snowflake_pull: bool,
+    source_is_sf: bool,
+    target_is_sf: bool,
     json_output: bool,
 ) -> None:
     """Print dry-run information showing what would be compared.
@@ -609,7 +705,8 @@ def _print_dry_run_info(
         target_at: Target time-travel
         threshold: Difference threshold
         limit: Result limit
-        use_snowflake_pull: Whether Snowflake pull would be used
+        source_is_sf: Whether the source is pulled from Snowflake
+        target_is_sf: Whether the target is pulled from Snowflake
         json_output: Whether to output as JSON
     """
     dry_run_info = {
@@ -617,12 +714,12 @@ def _print_dry_run_info(
         "source": {
             "table": source,
             "time_travel": source_at,
-            "is_snowflake": use_snowflake_pull and "sf." in source.lower(),
+            "is_snowflake": source_is_sf,
         },
         "target": {
             "table": target,
             "time_travel": target_at,
-            "is_snowflake": use_snowflake_pull and "sf." in target.lower(),
+            "is_snowflake": target_is_sf,
         },
         "comparison": {
             "key_column": key,
@@ -635,7 +732,7 @@ def _print_dry_run_info(
 
     # Describe what would happen
     operations = []
-    if use_snowflake_pull:
+    if source_is_sf or target_is_sf:
         operations.append("Pull data from Snowflake using native connector")
     operations.append("Compare table schemas")
     operations.append("Count rows in both tables")
@@ -688,7 +785,7 @@ def _handle_error(
         json_output: Whether JSON output is enabled
         start_time: Start time for duration calculation
     """
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     error_info = get_error_info(e)
 
     if json_output:
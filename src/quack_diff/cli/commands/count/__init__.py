@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
@@ -19,35 +21,58 @@ from quack_diff.cli.console import (
     set_json_output_mode,
     status_context,
 )
-from quack_diff.cli.errors import get_error_info
-from quack_diff.cli.formatters import print_count_result
+from quack_diff.cli.errors import error_prefix, get_error_info
 from quack_diff.cli.output import format_count_result_json, format_error_json, print_json
-from quack_diff.config import get_settings
-from quack_diff.core.connector import DuckDBConnector
-from quack_diff.core.differ import CountResult, DataDiffer, TableCount, Threshold
+from quack_diff.config import SnowflakeConfig, get_settings, get_snowflake_config
+from quack_diff.core import count_cache
 from quack_diff.core.sql_utils import (
-    AttachError,
     DatabaseError,
     QueryExecutionError,
     SQLInjectionError,
-    TableNotFoundError,
     sanitize_identifier,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from quack_diff.config import Settings
+    from quack_diff.core.connector import DuckDBConnector
+    from quack_diff.core.differ import Threshold
 
 logger = logging.getLogger(__name__)
 
 _TABLE_SPEC_RE = re.compile(r"^(?P<ref>[^\[\]]+?)(?:\[(?P<group_by>[^\]]*)\])?$")
 
+# One table in a comma-separated ``-t`` value; commas inside [...] are kept
+_TABLE_TOKEN_RE = re.compile(r"(?:[^,\[\]]|\[[^\[\]]*\])+")
+# A whole ``-t`` value made of such tokens; fails on unbalanced brackets
+_TABLE_ARG_RE = re.compile(rf"(?:{_TABLE_TOKEN_RE.pattern})?(?:,(?:{_TABLE_TOKEN_RE.pattern})?)*")
+
+# Table and column names recur across specs (e.g. one --sum-column for every
+# table), so validate each distinct identifier once. Failures are not cached.
+_sanitize = lru_cache(maxsize=2048)(sanitize_identifier)
+
+# Upper bound on concurrent Snowflake aggregate queries
+_MAX_PARALLEL_QUERIES = 8
+
+# Upper bound on DuckDB files opened concurrently by auto-attach
+_MAX_PARALLEL_ATTACHES = 4
 
-@dataclass
+# (count, sum) results for the lifetime of the process, keyed by
+# _metric_cache_key(). Local entries include the stat of the database file and
+# its WAL so they go stale as soon as the database is written. Local base-table entries are also
+# persisted across runs in quack_diff.core.count_cache.
+_METRIC_CACHE_MAX_SIZE = 256
+_metric_cache: dict[tuple, tuple[int, int | float | None]] = {}
+
+
+@dataclass(frozen=True)
 class TableSpec:
     """Parsed table specification with optional group-by columns.
 
     Created from the ``-t`` flag value, e.g.
-    ``"sf.DB.SCHEMA.TABLE[col1,col2]"``.
+    ``"sf.DB.SCHEMA.TABLE[col1,col2]"``. Frozen because parsed specs are
+    memoized and shared between callers.
     """
 
     raw: str
@@ -55,6 +80,40 @@ class TableSpec:
     table: str
     group_by: list[str] | None
     is_snowflake: bool
+    # Dotted ``alias.table`` reference used to query local tables
+    full_ref: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "full_ref", f"{self.alias}.{self.table}" if self.alias else self.table)
+
+
+# Alias lookup sets for the most recently used Settings object. Keeping the
+# reference alive guarantees its id() is not reused by another instance.
+_alias_sets: tuple[Settings, frozenset[str], frozenset[str]] | None = None
+
+
+def _known_aliases(settings: Settings) -> tuple[frozenset[str], frozenset[str]]:
+    """Return ``(known_aliases, snowflake_aliases)`` for *settings*.
+
+    The sets are rebuilt only when a different Settings object is passed in.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Tuple of (all configured aliases, aliases that point to Snowflake)
+    """
+    global _alias_sets
+    if _alias_sets is not None and _alias_sets[0] is settings:
+        return _alias_sets[1], _alias_sets[2]
+
+    databases = settings.databases or {}
+    known = frozenset(databases)
+    snowflake = frozenset(
+        alias for alias, db_config in databases.items() if db_config.get("type", "snowflake").lower() == "snowflake"
+    )
+    _alias_sets = (settings, known, snowflake)
+    return known, snowflake
 
 
 def _parse_table_spec(table: str, settings: Settings) -> TableSpec:
@@ -70,11 +129,25 @@ def _parse_table_spec(table: str, settings: Settings) -> TableSpec:
         settings: Application settings (used for alias resolution)
 
     Returns:
-        Parsed TableSpec
+        Parsed TableSpec (shared between calls with the same input)
 
     Raises:
         ValueError: If the syntax is invalid
     """
+    known_aliases, snowflake_aliases = _known_aliases(settings)
+    return _parse_table_spec_cached(table, known_aliases, snowflake_aliases)
+
+
+@lru_cache(maxsize=256)
+def _parse_table_spec_cached(
+    table: str,
+    known_aliases: frozenset[str],
+    snowflake_aliases: frozenset[str],
+) -> TableSpec:
+    """Memoized body of :func:`_parse_table_spec`.
+
+    Keyed on the alias sets rather than on Settings, which is unhashable.
+    """
     m = _TABLE_SPEC_RE.match(table.strip())
     if not m:
         raise ValueError(
@@ -85,12 +158,12 @@ def _parse_table_spec(table: str, settings: Settings) -> TableSpec:
     group_by_str = m.group("group_by")
     group_by: list[str] | None = None
     if group_by_str is not None:
-        group_by = [c.strip() for c in group_by_str.split(",") if c.strip()]
+        group_by = [col for c in group_by_str.split(",") if (col := c.strip())]
         if not group_by:
             raise ValueError(f"Empty group-by column list in: '{table}'")
 
-    alias, table_name = _parse_table_reference(ref, settings)
-    is_sf = _is_snowflake_ref(alias, settings)
+    alias, table_name = _parse_table_reference(ref, known_aliases)
+    is_sf = _is_snowflake_ref(alias, snowflake_aliases)
 
     return TableSpec(
         raw=table,
@@ -101,29 +174,24 @@ def _parse_table_spec(table: str, settings: Settings) -> TableSpec:
     )
 
 
-def _parse_table_reference(table: str, settings: Settings) -> tuple[str | None, str]:
+def _parse_table_reference(table: str, known_aliases: frozenset[str]) -> tuple[str | None, str]:
     """Extract alias and table name from a dotted reference."""
-    known_aliases = set(settings.databases.keys()) if settings.databases else set()
-    parts = table.split(".", 1)
-    if len(parts) == 2 and parts[0].lower() in ("sf", "snowflake"):
-        return parts[0].lower(), parts[1]
-    if len(parts) >= 2:
-        first_part = parts[0].lower()
-        if known_aliases and first_part in known_aliases:
-            return first_part, ".".join(parts[1:])
-        if len(first_part) <= 4 and first_part.isalpha():
-            return first_part, ".".join(parts[1:])
+    head, sep, rest = table.partition(".")
+    if not sep:
+        return None, table
+    first_part = head.lower()
+    if first_part in ("sf", "snowflake") or first_part in known_aliases:
+        return first_part, rest
+    if len(first_part) <= 4 and first_part.isalpha():
+        return first_part, rest
     return None, table
 
 
-def _is_snowflake_ref(alias: str | None, settings: Settings) -> bool:
+def _is_snowflake_ref(alias: str | None, snowflake_aliases: frozenset[str]) -> bool:
     """Return True when *alias* points to a Snowflake connection."""
     if alias in ("sf", "snowflake"):
         return True
-    if alias and alias in settings.databases:
-        db_config = settings.databases[alias]
-        return db_config.get("type", "snowflake").lower() == "snowflake"
-    return False
+    return alias is not None and alias in snowflake_aliases
 
 
 def _resolve_snowflake_config(alias: str | None, settings: Settings) -> tuple:
@@ -139,9 +207,7 @@ def _resolve_snowflake_config(alias: str | None, settings: Settings) -> tuple:
         connection_name = db_config.get("connection_name")
         database = db_config.get("database")
         if connection_name:
-            from quack_diff.config import SnowflakeConfig
-
-            config = SnowflakeConfig(connection_name=connection_name)
+            config = get_snowflake_config(connection_name)
     if config is None:
         config = settings.snowflake
     return config, database
@@ -170,16 +236,20 @@ def _build_count_query(
     if spec.group_by and key_column:
         raise ValueError(f"Cannot combine --key with per-table [group_by] (table: '{spec.raw}'). Use one or the other.")
 
-    sanitized_table = sanitize_identifier(table_ref or spec.table)
+    return _count_query_sql(table_ref or spec.table, tuple(spec.group_by or ()), key_column)
 
-    if spec.group_by:
-        sanitized_cols = [sanitize_identifier(c) for c in spec.group_by]
-        cols_str = ", ".join(sanitized_cols)
+
+@lru_cache(maxsize=256)
+def _count_query_sql(table: str, group_by: tuple[str, ...], key_column: str | None) -> str:
+    """Memoized SQL generation for :func:`_build_count_query`."""
+    sanitized_table = _sanitize(table)
+
+    if group_by:
+        cols_str = ", ".join(_sanitize(c) for c in group_by)
         return f"SELECT COUNT(*) FROM (SELECT 1 FROM {sanitized_table} GROUP BY {cols_str})"
 
     if key_column:
-        sanitized_key = sanitize_identifier(key_column)
-        return f"SELECT COUNT(DISTINCT {sanitized_key}) FROM {sanitized_table}"
+        return f"SELECT COUNT(DISTINCT {_sanitize(key_column)}) FROM {sanitized_table}"
 
     return f"SELECT COUNT(*) FROM {sanitized_table}"
 
@@ -207,30 +277,114 @@ def _build_sum_query(
     Returns:
         SQL query string
     """
-    sanitized_table = sanitize_identifier(table_ref or spec.table)
-    sanitized_col = sanitize_identifier(sum_column)
+    sanitized_table = _sanitize(table_ref or spec.table)
+    sanitized_col = _sanitize(sum_column)
     return f"SELECT SUM({sanitized_col}) FROM {sanitized_table}"
 
 
-def _full_table_ref(spec: TableSpec) -> str:
-    """Reconstruct the dotted ``alias.table`` reference for local queries."""
-    if spec.alias:
-        return f"{spec.alias}.{spec.table}"
-    return spec.table
+def _build_metrics_query(
+    spec: TableSpec,
+    key_column: str | None = None,
+    sum_column: str | None = None,
+    table_ref: str | None = None,
+) -> str:
+    """Build a single query returning the count (and optional SUM) for *spec*.
 
+    Without a group-by the aggregates share one scan::
 
-def _execute_direct_metrics(
-    connector: DuckDBConnector,
-    settings: Settings,
+        SELECT COUNT(*), SUM(col) FROM t
+
+    With a per-table [group_by] the count and the whole-table SUM need
+    different shapes, so both are emitted as scalar subqueries of one
+    SELECT. Either way the metrics come back in a single round trip.
+
+    Args:
+        spec: Parsed table specification
+        key_column: If set, use COUNT(DISTINCT key_column)
+        sum_column: Optional column to SUM() alongside the count
+        table_ref: Override for the fully-qualified table reference to use
+            in the generated SQL.  When *None* the spec's ``table`` field
+            is used.
+
+    Returns:
+        SQL query string whose first column is the count and, when
+        *sum_column* is set, whose second column is the sum
+
+    Raises:
+        ValueError: If both group_by and key_column are specified
+    """
+    count_query = _build_count_query(spec, key_column, table_ref=table_ref)
+    if not sum_column:
+        return count_query
+
+    if spec.group_by:
+        sum_query = _build_sum_query(spec, sum_column, table_ref=table_ref)
+        return f"SELECT ({count_query}), ({sum_query})"
+
+    sanitized_table = _sanitize(table_ref or spec.table)
+    sanitized_col = _sanitize(sum_column)
+    count_expr = f"COUNT(DISTINCT {_sanitize(key_column)})" if key_column else "COUNT(*)"
+    return f"SELECT {count_expr}, SUM({sanitized_col}) FROM {sanitized_table}"
+
+
+@dataclass(frozen=True)
+class _QueryPlan:
+    """SQL and connection target for one table, built before any query runs."""
+
+    spec: TableSpec
+    count_sql: str
+    sum_sql: str | None
+    metrics_sql: str
+    config: SnowflakeConfig | None = None
+    database: str | None = None
+
+
+def _plan_queries(
     spec: TableSpec,
+    settings: Settings,
     key_column: str | None = None,
     sum_column: str | None = None,
+) -> _QueryPlan:
+    """Build the queries needed to fetch the metrics of *spec*.
+
+    Snowflake tables are queried by their table part (the alias is a
+    connection ref, not a DB prefix) and carry the resolved connection.
+    DuckDB tables use ``alias.table`` so attached databases resolve.
+
+    Args:
+        spec: Parsed table specification
+        settings: Application settings
+        key_column: If set, use COUNT(DISTINCT key_column)
+        sum_column: Optional column to SUM() alongside the count
+
+    Returns:
+        Query plan for the table
+
+    Raises:
+        ValueError: If both group_by and key_column are specified
+    """
+    table_ref = None if spec.is_snowflake else spec.full_ref
+    config, database = _resolve_snowflake_config(spec.alias, settings) if spec.is_snowflake else (None, None)
+    return _QueryPlan(
+        spec=spec,
+        count_sql=_build_count_query(spec, key_column, table_ref=table_ref),
+        sum_sql=_build_sum_query(spec, sum_column, table_ref=table_ref) if sum_column else None,
+        metrics_sql=_build_metrics_query(spec, key_column, sum_column, table_ref=table_ref),
+        config=config,
+        database=database,
+    )
+
+
+def _execute_direct_metrics(
+    connector: DuckDBConnector,
+    plan: _QueryPlan,
     verbose: bool = False,
 ) -> tuple[int, int | float | None]:
-    """Execute aggregate queries for *spec* on the appropriate backend.
+    """Execute the aggregate query of *plan* on the appropriate backend.
 
-    Always computes a COUNT (or COUNT(DISTINCT key_column)) and, when
-    *sum_column* is provided, also computes a SUM(sum_column).
+    Always computes a COUNT (or COUNT(DISTINCT key_column)) and, when the
+    plan has a SUM, also computes it. Both are fetched with a single query
+    (see :func:`_build_metrics_query`).
 
     Snowflake tables are aggregated directly on Snowflake (no data
     transfer). DuckDB / local tables are aggregated via the DuckDB
@@ -239,42 +393,419 @@ def _execute_direct_metrics(
     Returns:
         Tuple of (row_count, sum_value_or_None)
     """
-    # COUNT / COUNT(DISTINCT ...)
-    count_query = _build_count_query(spec, key_column)
-
+    spec = plan.spec
+    query = plan.metrics_sql
     if spec.is_snowflake:
-        # Snowflake: use just the table part (alias is a connection ref, not a DB prefix)
-        config, database = _resolve_snowflake_config(spec.alias, settings)
         if verbose:
             print_info(f"Counting on Snowflake: {spec.raw}")
-            logger.debug(f"Snowflake count query: {count_query}")
-        count_result = connector.execute_snowflake_scalar(query=count_query, config=config, database=database)
-
-        sum_result: int | float | None = None
-        if sum_column:
-            sum_query = _build_sum_query(spec, sum_column)
-            if verbose:
-                logger.debug(f"Snowflake sum query: {sum_query}")
-            sum_result = connector.execute_snowflake_scalar(query=sum_query, config=config, database=database)
+            logger.debug(f"Snowflake metrics query: {query}")
+        row: tuple | None = connector.execute_snowflake_row(query=query, config=plan.config, database=plan.database)
     else:
-        # DuckDB: reconstruct alias.table for attached databases
-        table_ref = _full_table_ref(spec)
-        query = _build_count_query(spec, key_column, table_ref=table_ref)
         if verbose:
             print_info(f"Counting locally: {spec.raw}")
-            logger.debug(f"DuckDB count query: {query}")
+            logger.debug(f"DuckDB metrics query: {query}")
         row = connector.execute_fetchone(query)
-        count_result = row[0] if row else 0
 
-        sum_result = None
-        if sum_column:
-            sum_query = _build_sum_query(spec, sum_column, table_ref=table_ref)
-            if verbose:
-                logger.debug(f"DuckDB sum query: {sum_query}")
-            sum_row = connector.execute_fetchone(sum_query)
-            sum_result = sum_row[0] if sum_row else 0
+    has_sum = plan.sum_sql is not None
+    if not row:
+        return 0, (0 if has_sum else None)
+
+    sum_result: int | float | None = row[1] if has_sum else None
+    return int(row[0]), sum_result
+
+
+def _build_batch_query(plans: list[_QueryPlan]) -> tuple[str, int]:
+    """Combine the metrics queries of several tables into one query.
+
+    Each table's fused metrics query (see :func:`_build_metrics_query`)
+    becomes a single-row derived table, and the derived tables are cross
+    joined into one row, so COUNT and SUM still share one scan per table::
 
-    return int(count_result), sum_result
+        SELECT * FROM (SELECT COUNT(*), SUM(a) FROM t0) AS m0, (...) AS m1
+
+    Args:
+        plans: Query plans to combine
+
+    Returns:
+        Tuple of (SQL query, expected number of result columns)
+    """
+    # Aggregates without GROUP BY always return exactly one row
+    query = "SELECT * FROM " + ", ".join(f"({plan.metrics_sql}) AS m{i}" for i, plan in enumerate(plans))
+    return query, sum(1 if plan.sum_sql is None else 2 for plan in plans)
+
+
+def _unpack_batch_row(
+    row: tuple | None,
+    plans: list[_QueryPlan],
+    query: str,
+    expected_columns: int,
+) -> list[tuple[int, int | float | None]]:
+    """Split the row of a :func:`_build_batch_query` result into per-table metrics.
+
+    Raises:
+        QueryExecutionError: If the row does not have one column per metric
+    """
+    if row is None or len(row) != expected_columns:
+        raise QueryExecutionError(
+            f"Batched count query returned {0 if row is None else len(row)} columns (expected {expected_columns})",
+            query=query,
+        )
+    values = iter(row)
+    return [(int(next(values)), next(values) if plan.sum_sql is not None else None) for plan in plans]
+
+
+def _execute_snowflake_batch(
+    connector: DuckDBConnector,
+    plans: list[_QueryPlan],
+    verbose: bool = False,
+) -> list[tuple[int, int | float | None]]:
+    """Fetch the metrics of several Snowflake tables in one round trip.
+
+    N tables behind the same alias cost one query and one warehouse
+    wake-up instead of N (see :func:`_build_batch_query`).
+
+    Args:
+        connector: DuckDB connector (owns the Snowflake session)
+        plans: Query plans of Snowflake tables sharing one alias
+        verbose: Enable verbose output
+
+    Returns:
+        (count, sum) per plan, in the order of *plans*
+
+    Raises:
+        QueryExecutionError: If the result does not have one column per metric
+    """
+    query, expected_columns = _build_batch_query(plans)
+    if verbose:
+        print_info(f"Counting on Snowflake: {', '.join(plan.spec.raw for plan in plans)}")
+        logger.debug(f"Snowflake batch query: {query}")
+    row = connector.execute_snowflake_row(query=query, config=plans[0].config, database=plans[0].database)
+    return _unpack_batch_row(row, plans, query, expected_columns)
+
+
+def _execute_local_batch(
+    connector: DuckDBConnector,
+    plans: list[_QueryPlan],
+    verbose: bool = False,
+) -> list[tuple[int, int | float | None]]:
+    """Fetch the metrics of several local tables with one DuckDB query.
+
+    DuckDB parses and plans the combined query once and schedules all the
+    scans together. If it fails, the tables are counted one by one so the
+    error names the offending table.
+
+    Args:
+        connector: DuckDB connector
+        plans: Query plans of local tables
+        verbose: Enable verbose output
+
+    Returns:
+        (count, sum) per plan, in the order of *plans*
+    """
+    query, expected_columns = _build_batch_query(plans)
+    if verbose:
+        print_info(f"Counting locally: {', '.join(plan.spec.raw for plan in plans)}")
+        logger.debug(f"DuckDB batch query: {query}")
+    try:
+        row = connector.execute_fetchone(query)
+    except DatabaseError:
+        return [_execute_direct_metrics(connector, plan, verbose) for plan in plans]
+    return _unpack_batch_row(row, plans, query, expected_columns)
+
+
+def _metric_cache_key(
+    spec: TableSpec,
+    settings: Settings,
+    key_column: str | None,
+    sum_column: str | None,
+) -> tuple | None:
+    """Return the :data:`_metric_cache` key for *spec*, or None if uncacheable.
+
+    Snowflake results are keyed by the alias' connection and database.
+    Local results are only cached for tables in a configured DuckDB file,
+    keyed by its path plus the mtime and size of the file and of its
+    ``.wal`` (writes not yet checkpointed land there); anything else may
+    change under us. Keys
+    are JSON-serializable so local ones can double as :mod:`count_cache` keys.
+    """
+    db_config = settings.databases.get(spec.alias, {}) if spec.alias else {}
+    if spec.is_snowflake:
+        target: tuple = (db_config.get("connection_name"), db_config.get("database"))
+    else:
+        path = db_config.get("path")
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        try:
+            wal_stat = os.stat(f"{path}.wal")
+            wal: tuple | None = (wal_stat.st_mtime_ns, wal_stat.st_size)
+        except FileNotFoundError:
+            wal = None
+        except OSError:
+            return None
+        target = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, wal)
+    group_by = tuple(spec.group_by) if spec.group_by else ()
+    return (spec.is_snowflake, spec.alias, target, spec.table, group_by, key_column, sum_column)
+
+
+def _local_base_tables(connector: DuckDBConnector, specs: list[TableSpec]) -> set[int]:
+    """Return the positions of *specs* that are base tables of an attached database.
+
+    Views may read other files (e.g. ``read_parquet``), so the mtime of
+    their database file does not tell whether their count changed; only
+    base tables are safe to persist in :mod:`count_cache`.
+
+    Args:
+        connector: DuckDB connector with the databases attached
+        specs: Parsed local table specifications
+
+    Returns:
+        Indices into *specs* of the specs naming a base table
+    """
+    wanted: dict[tuple[str, str, str], list[int]] = {}
+    for i, spec in enumerate(specs):
+        parts = spec.table.lower().split(".")
+        if spec.alias and len(parts) <= 2:
+            schema, name = parts if len(parts) == 2 else ("main", parts[0])
+            wanted.setdefault((spec.alias.lower(), schema, name), []).append(i)
+    if not wanted:
+        return set()
+
+    aliases = sorted({alias for alias, _, _ in wanted})
+    placeholders = ", ".join("?" for _ in aliases)
+    try:
+        rows = connector.execute_fetchall(
+            "SELECT lower(database_name), lower(schema_name), lower(table_name) "
+            f"FROM duckdb_tables() WHERE lower(database_name) IN ({placeholders})",
+            aliases,
+        )
+    except DatabaseError as e:
+        logger.debug(f"Could not list base tables for the count cache: {e}")
+        return set()
+    return {i for row in rows for i in wanted.get(tuple(row), ())}
+
+
+def _is_certain_mismatch(
+    metrics: dict[int, tuple[int, int | float | None]],
+    count_threshold: Threshold | None = None,
+    sum_threshold: Threshold | None = None,
+) -> bool:
+    """Return True when partial results already guarantee a failed check.
+
+    Tables are compared against the first one, so with thresholds the
+    reference (index 0) must be known. Without thresholds any two differing
+    values are enough, since they cannot both equal the reference.
+
+    Args:
+        metrics: (count, sum) keyed by the table's position in ``-t`` order
+        count_threshold: Tolerance for row counts
+        sum_threshold: Tolerance for sum values
+
+    Returns:
+        True if the remaining tables cannot turn the result into a match
+    """
+    from quack_diff.core.differ import CountResult, TableCount
+
+    if len(metrics) < 2:
+        return False
+    if 0 not in metrics and (count_threshold is not None or sum_threshold is not None):
+        return False
+
+    partial = CountResult(
+        table_counts=[TableCount(table=str(i), count=metrics[i][0], sum_value=metrics[i][1]) for i in sorted(metrics)],
+        count_threshold=count_threshold,
+        sum_threshold=sum_threshold,
+    )
+    return not partial.within_threshold
+
+
+def _collect_direct_metrics(
+    connector: DuckDBConnector,
+    settings: Settings,
+    specs: list[TableSpec],
+    key_column: str | None,
+    sum_columns: list[str | None],
+    verbose: bool = False,
+    use_cache: bool = True,
+    stop: Callable[[dict[int, tuple[int, int | float | None]]], bool] | None = None,
+) -> list[tuple[int, int | float | None] | None]:
+    """Compute the (count, sum) metrics for every spec.
+
+    A table listed more than once (same alias, table, group-by and SUM
+    column) is only queried once and the result is fanned out to every
+    occurrence. Results are also remembered in :data:`_metric_cache` for
+    the rest of the process, and local base-table results in
+    :mod:`count_cache` across runs. *use_cache* False skips the lookups
+    but still records the fresh results.
+
+    Args:
+        connector: DuckDB connector
+        settings: Application settings
+        specs: Parsed table specifications
+        key_column: Optional column for COUNT(DISTINCT ...)
+        sum_columns: Per-table SUM column (or None), aligned with *specs*
+        verbose: Enable verbose output
+        use_cache: Reuse results cached by earlier calls
+        stop: Called with the results known so far (keyed by spec index);
+            returning True skips the tables not yet queried
+
+    Returns:
+        (count, sum) per spec, in the order of *specs*. Tables skipped
+        because of *stop* are None.
+    """
+    keys = [_metric_cache_key(spec, settings, key_column, col) for spec, col in zip(specs, sum_columns, strict=True)]
+
+    # One cache connection serves the whole run; writes commit on exit
+    with count_cache.CountCache() as persistent:
+        results: list[tuple[int, int | float | None] | None] = [None] * len(specs)
+        pending: list[int] = []
+        # Position of the first spec producing the same query, for every spec
+        first_index: list[int] = []
+        seen: dict[tuple, int] = {}
+        for i, (spec, sum_column, key) in enumerate(zip(specs, sum_columns, keys, strict=True)):
+            query_key = (spec.is_snowflake, spec.alias, spec.table, tuple(spec.group_by or ()), sum_column)
+            first_index.append(seen.setdefault(query_key, i))
+            if first_index[i] != i:
+                continue
+            if use_cache and key is not None:
+                if key in _metric_cache:
+                    results[i] = _metric_cache[key]
+                elif not spec.is_snowflake and (stored := persistent.get(key)) is not None:
+                    results[i] = _metric_cache[key] = stored
+            if results[i] is None:
+                pending.append(i)
+
+        known = {i: metrics for i, metrics in enumerate(results) if metrics is not None}
+        fetch_stop = None
+        if stop is not None:
+            if stop(known):
+                return _share_duplicates(results, first_index)
+
+            def fetch_stop(partial: dict[int, tuple[int, int | float | None]]) -> bool:
+                return stop({**known, **{pending[j]: metrics for j, metrics in partial.items()}})
+
+        plans = [_plan_queries(specs[i], settings, key_column, sum_columns[i]) for i in pending]
+        fetched = _fetch_direct_metrics(connector, plans, verbose, stop=fetch_stop)
+        persistable = [j for j in fetched if keys[pending[j]] is not None and not specs[pending[j]].is_snowflake]
+        base_tables = _local_base_tables(connector, [specs[pending[j]] for j in persistable]) if persistable else set()
+        persist = {persistable[k] for k in base_tables}
+        for j, metrics in fetched.items():
+            i = pending[j]
+            results[i] = metrics
+            key = keys[i]
+            if key is not None:
+                if len(_metric_cache) >= _METRIC_CACHE_MAX_SIZE:
+                    _metric_cache.pop(next(iter(_metric_cache)))
+                _metric_cache[key] = metrics
+                if j in persist:
+                    persistent.put(key, metrics)
+
+    return _share_duplicates(results, first_index)
+
+
+def _share_duplicates(
+    results: list[tuple[int, int | float | None] | None],
+    first_index: list[int],
+) -> list[tuple[int, int | float | None] | None]:
+    """Copy each table's result to its later duplicates in ``-t`` order.
+
+    Args:
+        results: Per-spec metrics, filled in for first occurrences only
+        first_index: Position of the first spec producing the same query
+
+    Returns:
+        *results*, with every duplicate set (in place)
+    """
+    for i, first in enumerate(first_index):
+        if first != i:
+            results[i] = results[first]
+    return results
+
+
+def _fetch_direct_metrics(
+    connector: DuckDBConnector,
+    plans: list[_QueryPlan],
+    verbose: bool = False,
+    stop: Callable[[dict[int, tuple[int, int | float | None]]], bool] | None = None,
+) -> dict[int, tuple[int, int | float | None]]:
+    """Run the query plans and return the (count, sum) metrics.
+
+    Snowflake plans are grouped by alias and each group is fetched with a
+    single batched query (see :func:`_execute_snowflake_batch`). Groups are
+    independent network round-trips, so they are issued concurrently on a
+    thread pool. Local DuckDB tables are combined into one query (see
+    :func:`_execute_local_batch`) that runs on the calling thread while the
+    remote ones are in flight.
+
+    Args:
+        connector: DuckDB connector
+        plans: Query plans built by :func:`_plan_queries`
+        verbose: Enable verbose output
+        stop: Checked after every result; returning True cancels the
+            queries that have not started yet
+
+    Returns:
+        (count, sum) keyed by index into *plans*; complete unless *stop*
+        returned True. Groups that were already running when *stop* fired
+        still finish, and their results are kept.
+    """
+    from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+    groups: dict[str | None, list[int]] = {}
+    for i, plan in enumerate(plans):
+        if plan.spec.is_snowflake:
+            groups.setdefault(plan.spec.alias, []).append(i)
+
+    def run(i: int) -> tuple[int, int | float | None]:
+        return _execute_direct_metrics(connector, plans[i], verbose)
+
+    def run_group(indices: list[int]) -> list[tuple[int, int | float | None]]:
+        if len(indices) == 1:
+            return [run(indices[0])]
+        return _execute_snowflake_batch(connector, [plans[i] for i in indices], verbose)
+
+    results: dict[int, tuple[int, int | float | None]] = {}
+    local = [i for i, plan in enumerate(plans) if not plan.spec.is_snowflake]
+
+    def run_local() -> bool:
+        """Run the local queries; return True if *stop* fired."""
+        if len(local) > 1:
+            batch = _execute_local_batch(connector, [plans[i] for i in local], verbose)
+            results.update(zip(local, batch, strict=True))
+        elif local:
+            results[local[0]] = run(local[0])
+        return bool(local) and stop is not None and stop(results)
+
+    if len(groups) < 2:
+        for indices in groups.values():
+            results.update(zip(indices, run_group(indices), strict=True))
+            if stop is not None and stop(results):
+                return results
+        run_local()
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=min(len(groups), _MAX_PARALLEL_QUERIES))
+    futures: dict[Future[list[tuple[int, int | float | None]]], list[int]] = {}
+    try:
+        futures = {executor.submit(run_group, indices): indices for indices in groups.values()}
+        if not run_local():
+            for future in as_completed(futures):
+                results.update(zip(futures[future], future.result(), strict=True))
+                if stop is not None and stop(results):
+                    break
+    finally:
+        # Queries already running finish; queued ones are dropped
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    # Keep the groups that finished after *stop* fired; their cost is already paid
+    for future, indices in futures.items():
+        if indices[0] not in results and not future.cancelled() and future.exception() is None:
+            results.update(zip(indices, future.result(), strict=True))
+
+    return results
 
 
 def _auto_attach_databases(
@@ -283,12 +814,17 @@ def _auto_attach_databases(
     specs: list[TableSpec],
     verbose: bool = False,
 ) -> None:
-    """Auto-attach DuckDB databases for non-Snowflake aliases."""
+    """Auto-attach DuckDB databases for non-Snowflake aliases.
+
+    Each attach opens a file, which can be slow on network filesystems, so
+    several databases are attached concurrently.
+    """
+    pairs: dict[str, str] = {}
     for spec in specs:
         alias = spec.alias
-        if not alias or spec.is_snowflake:
+        if not alias or spec.is_snowflake or alias in pairs:
             continue
-        if alias in connector.attached_databases:
+        if connector.is_attached(alias):
             continue
         if alias in settings.databases:
             db_config = settings.databases[alias]
@@ -296,9 +832,22 @@ def _auto_attach_databases(
             if db_type == "duckdb":
                 path = db_config.get("path")
                 if path:
-                    if verbose:
-                        print_info(f"Attaching DuckDB database: {path} as '{alias}'")
-                    connector.attach_duckdb(alias, str(path))
+                    pairs[alias] = str(path)
+
+    if verbose:
+        for alias, path in pairs.items():
+            print_info(f"Attaching DuckDB database: {path} as '{alias}'")
+
+    if len(pairs) <= 1:
+        for alias, path in pairs.items():
+            connector.attach_duckdb(alias, path)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(pairs), _MAX_PARALLEL_ATTACHES)) as executor:
+        # list() re-raises the first attach error
+        list(executor.map(connector.attach_duckdb, pairs.keys(), pairs.values()))
 
 
 def count(
@@ -355,6 +904,23 @@ def count(
             help="Path to configuration file (YAML)",
         ),
     ] = None,
+    fail_fast: Annotated[
+        bool,
+        typer.Option(
+            "--fail-fast/--no-fail-fast",
+            help=(
+                "Stop querying remaining tables once the counts are known to differ "
+                "(ignored with --json, which always reports every table)"
+            ),
+        ),
+    ] = True,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Re-run every query instead of reusing cached results",
+        ),
+    ] = False,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -401,7 +967,12 @@ def count(
     if json_output:
         set_json_output_mode(True)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
+
+    # Deferred so --help skips the connector/differ/formatter imports
+    from quack_diff.cli.formatters import print_count_result
+    from quack_diff.core.connector import DuckDBConnector
+    from quack_diff.core.differ import CountResult, DataDiffer, TableCount, Threshold
 
     # Parse threshold values
     parsed_count_threshold: Threshold | None = None
@@ -422,8 +993,15 @@ def count(
     # Flatten: support both -t a -t b and -t "a,b"
     # Be careful not to split inside [...] brackets
     flat_tables: list[str] = []
-    for t in tables:
-        flat_tables.extend(_split_table_arg(t))
+    try:
+        for t in tables:
+            flat_tables.extend(_split_table_arg(t))
+    except ValueError as exc:
+        if json_output:
+            print_json(format_error_json(error_type="ValueError", message=str(exc), exit_code=2))
+        else:
+            print_error(str(exc))
+        raise typer.Exit(2) from None
 
     # Normalise --sum-column values to a per-table list
     per_table_sum_columns: list[str | None] = [None] * len(flat_tables)
@@ -431,7 +1009,7 @@ def count(
         flat_sums: list[str] = []
         for s in sum_columns:
             # Allow simple comma-separated syntax
-            flat_sums.extend([part.strip() for part in s.split(",") if part.strip()])
+            flat_sums.extend(col for part in s.split(",") if (col := part.strip()))
 
         if len(flat_sums) == 1:
             # Single column applied to all tables
@@ -484,6 +1062,19 @@ def count(
         # legacy differ.count_check path.
         use_direct = any_snowflake or any_has_group_by
 
+        # Tables left unqueried because an earlier mismatch settled the result.
+        # JSON consumers get a full report, so they never stop early.
+        skipped = 0
+        stop = (
+            partial(
+                _is_certain_mismatch,
+                count_threshold=parsed_count_threshold,
+                sum_threshold=parsed_sum_threshold,
+            )
+            if fail_fast and not json_output
+            else None
+        )
+
         with DuckDBConnector(settings=settings) as connector:
             if use_direct:
                 # Attach any DuckDB databases needed for local tables
@@ -491,18 +1082,25 @@ def count(
 
                 status_msg = "Counting on Snowflake..." if any_snowflake else "Counting..."
                 with status_context(status_msg):
+                    metrics = _collect_direct_metrics(
+                        connector=connector,
+                        settings=settings,
+                        specs=specs,
+                        key_column=key,
+                        sum_columns=per_table_sum_columns,
+                        verbose=verbose,
+                        use_cache=not no_cache,
+                        stop=stop,
+                    )
                     table_counts: list[TableCount] = []
-                    display_name_map: dict[str, str] = {}
-                    for i, spec in enumerate(specs):
-                        sum_col = per_table_sum_columns[i] if i < len(per_table_sum_columns) else None
-                        count_val, sum_val = _execute_direct_metrics(
-                            connector=connector,
-                            settings=settings,
-                            spec=spec,
-                            key_column=key,
-                            sum_column=sum_col,
-                            verbose=verbose,
-                        )
+                    display_name_map: dict[str, str] | None = {}
+                    for i, (spec, sum_col, table_metrics) in enumerate(
+                        zip(specs, per_table_sum_columns, metrics, strict=True)
+                    ):
+                        if table_metrics is None:
+                            skipped += 1
+                            continue
+                        count_val, sum_val = table_metrics
                         label = f"__direct_{i}"
                         table_counts.append(
                             TableCount(
@@ -520,12 +1118,13 @@ def count(
                     count_threshold=parsed_count_threshold,
                     sum_threshold=parsed_sum_threshold,
                 )
-                result.is_match = result.count_within_threshold and (result.sum_within_threshold is not False)
+                result.is_match = result.within_threshold
             else:
                 # Legacy path: all local, no group-by
-                plain_tables = [_full_table_ref(s) for s in specs]
+                plain_tables = [s.full_ref for s in specs]
                 _auto_attach_databases(connector, settings, specs, verbose)
-                display_name_map = {_full_table_ref(s): s.raw for s in specs}
+                # Only specs whose -t value differs from the queried reference need a display name
+                display_name_map = {s.full_ref: s.raw for s in specs if s.raw != s.full_ref} or None
 
                 differ = DataDiffer(
                     connector=connector,
@@ -539,9 +1138,9 @@ def count(
                     )
                 result.count_threshold = parsed_count_threshold
                 result.sum_threshold = parsed_sum_threshold
-                result.is_match = result.count_within_threshold and (result.sum_within_threshold is not False)
+                result.is_match = result.within_threshold
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         if json_output:
             json_data = format_count_result_json(
@@ -552,62 +1151,36 @@ def count(
             print_json(json_data)
         else:
             print_count_result(result, display_name_map=display_name_map)
+            if skipped:
+                print_info(f"Stopped at the first mismatch; {skipped} table(s) not queried (use --no-fail-fast)")
 
+    except typer.Exit:
+        raise
+    except Exception as e:
+        _handle_error(e, error_prefix(e), verbose, json_output, start_time)
+    else:
+        # Exit outside the try so the result does not unwind through the handlers
         if result.is_match:
-            exact = result.count_match and (result.sum_match is not False)
-            if exact:
+            if result.metrics_match:
                 print_success("All table counts match!")
             else:
                 print_success("All metrics within threshold")
             raise typer.Exit(0)
-        else:
-            print_error("Table counts do not match")
-            raise typer.Exit(1)
-
-    except typer.Exit:
-        raise
-    except TableNotFoundError as e:
-        _handle_error(e, "Table not found", verbose, json_output, start_time)
-    except QueryExecutionError as e:
-        _handle_error(e, "Query execution error", verbose, json_output, start_time)
-    except SQLInjectionError as e:
-        _handle_error(e, "Invalid input", verbose, json_output, start_time)
-    except AttachError as e:
-        _handle_error(e, "Database attach error", verbose, json_output, start_time)
-    except DatabaseError as e:
-        _handle_error(e, "Database error", verbose, json_output, start_time)
-    except ValueError as e:
-        _handle_error(e, "Invalid value", verbose, json_output, start_time)
-    except Exception as e:
-        _handle_error(e, "Unexpected error", verbose, json_output, start_time)
+        print_error("Table counts do not match")
+        raise typer.Exit(1)
 
 
 def _split_table_arg(value: str) -> list[str]:
     """Split a comma-separated ``-t`` value, respecting ``[...]`` brackets.
 
     ``"sf.A,sf.B[x,y]"`` -> ``["sf.A", "sf.B[x,y]"]``
+
+    Raises:
+        ValueError: If the value has unbalanced or nested brackets
     """
-    parts: list[str] = []
-    current: list[str] = []
-    depth = 0
-    for ch in value:
-        if ch == "[":
-            depth += 1
-            current.append(ch)
-        elif ch == "]":
-            depth = max(depth - 1, 0)
-            current.append(ch)
-        elif ch == "," and depth == 0:
-            token = "".join(current).strip()
-            if token:
-                parts.append(token)
-            current = []
-        else:
-            current.append(ch)
-    token = "".join(current).strip()
-    if token:
-        parts.append(token)
-    return parts
+    if not _TABLE_ARG_RE.fullmatch(value):
+        raise ValueError(f"Unbalanced brackets in table argument: '{value}'")
+    return [token for m in _TABLE_TOKEN_RE.finditer(value) if (token := m.group(0).strip())]
 
 
 def _handle_error(
@@ -618,9 +1191,7 @@ def _handle_error(
     start_time: float,
 ) -> None:
     """Handle an error with appropriate output format."""
-    import time as time_module
-
-    duration = time_module.time() - start_time
+    duration = time.perf_counter() - start_time
     error_info = get_error_info(e)
 
     if json_output:
@@ -14,23 +14,13 @@ from quack_diff.cli.console import (
     set_json_output_mode,
     status_context,
 )
-from quack_diff.cli.errors import get_error_info
-from quack_diff.cli.formatters import print_schema_result
+from quack_diff.cli.errors import error_prefix, get_error_info
 from quack_diff.cli.output import (
     format_error_json,
     format_schema_result_json,
     print_json,
 )
 from quack_diff.config import get_settings
-from quack_diff.core.connector import DuckDBConnector
-from quack_diff.core.differ import DataDiffer
-from quack_diff.core.sql_utils import (
-    DatabaseError,
-    QueryExecutionError,
-    SchemaError,
-    SQLInjectionError,
-    TableNotFoundError,
-)
 
 
 def schema(
@@ -93,7 +83,7 @@ def schema(
     if json_output:
         set_json_output_mode(True)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Handle dry-run mode
@@ -101,6 +91,11 @@ def schema(
             _print_dry_run_info(source, target, json_output)
             raise typer.Exit(0)
 
+        # Deferred so --help and --dry-run skip the connector/differ/formatter imports
+        from quack_diff.cli.formatters import print_schema_result
+        from quack_diff.core.connector import DuckDBConnector
+        from quack_diff.core.differ import DataDiffer
+
         settings = get_settings(config_file=config_file)
 
         with DuckDBConnector(settings=settings) as connector:
@@ -112,7 +107,7 @@ def schema(
                     target_table=target,
                 )
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Output results based on format
             if json_output:
@@ -133,18 +128,8 @@ def schema(
 
     except typer.Exit:
         raise
-    except TableNotFoundError as e:
-        _handle_error(e, "Table not found", json_output, start_time)
-    except SchemaError as e:
-        _handle_error(e, "Schema error", json_output, start_time)
-    except QueryExecutionError as e:
-        _handle_error(e, "Query execution error", json_output, start_time)
-    except SQLInjectionError as e:
-        _handle_error(e, "Invalid input", json_output, start_time)
-    except DatabaseError as e:
-        _handle_error(e, "Database error", json_output, start_time)
     except Exception as e:
-        _handle_error(e, "Unexpected error", json_output, start_time)
+        _handle_error(e, error_prefix(e), json_output, start_time)
 
 
 def _print_dry_run_info(source: str, target: str, json_output: bool) -> None:
@@ -197,7 +182,7 @@ def _handle_error(
         json_output: Whether JSON output is enabled
         start_time: Start time for duration calculation
     """
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     error_info = get_error_info(e)
 
     if json_output:
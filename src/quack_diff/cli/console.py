@@ -2,23 +2,17 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from rich.theme import Theme
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from rich.progress import Progress
+
 # Custom theme for quack-diff
 QUACK_THEME = Theme(
     {
@@ -97,6 +91,16 @@ def create_progress(
     Returns:
         Configured Progress instance
     """
+    # Deferred: only commands that report progress need rich.progress
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -118,6 +122,8 @@ def create_spinner(description: str = "Working...") -> Progress:
     Returns:
         Configured Progress instance with spinner only
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -155,23 +161,25 @@ def progress_context(
         yield progress, task
 
 
-@contextmanager
-def status_context(message: str) -> Generator[None, None, None]:
+def status_context(message: str) -> AbstractContextManager[Any]:
     """Context manager for showing a status spinner.
 
+    The spinner renders on stderr, so it stays visible (and out of the
+    file) when stdout is redirected. In JSON output mode, or when stderr is
+    not a terminal (e.g. CI logs), a no-op context is returned, so no Rich
+    Status (and its refresh thread) is created.
+
     Args:
         message: Status message to display
 
-    Yields:
-        None
+    Returns:
+        Context manager that shows the spinner while active
 
     Example:
         with status_context("Connecting to Snowflake..."):
             connect_to_snowflake()
     """
-    if _json_output_mode:
-        yield
-        return
+    if _json_output_mode or not error_console.is_terminal:
+        return nullcontext()
 
-    with console.status(f"[info]{message}[/info]", spinner="dots"):
-        yield
+    return error_console.status(f"[info]{message}[/info]", spinner="dots")
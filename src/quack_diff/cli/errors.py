@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from quack_diff.core.sql_utils import (
+    AttachError,
+    DatabaseError,
+    KeyColumnError,
+    QueryExecutionError,
+    SchemaError,
+    SQLInjectionError,
+    TableNotFoundError,
+)
+
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorInfo:
     """Information about an error with recovery suggestion."""
 
@@ -19,78 +31,100 @@ class ErrorInfo:
     recovery_suggestion: str | None = None
 
 
-# Mapping of error types to recovery suggestions
-ERROR_RECOVERY_SUGGESTIONS: dict[str, str] = {
-    # Table errors
-    "TableNotFoundError": (
-        "Check that the table name is correct and fully qualified (database.schema.table). "
-        "Verify the table exists using `SHOW TABLES` or your database's catalog."
-    ),
-    # Key column errors
-    "KeyColumnError": (
-        "Ensure the key column exists in both tables. "
-        "Use `--verbose` to see available columns, or run `quack-diff schema` to compare schemas first."
-    ),
-    # Schema errors
-    "SchemaError": (
-        "Tables may have incompatible schemas. Run `quack-diff schema --source <source> --target <target>` "
-        "to see detailed schema differences. Consider using `--columns` to compare specific columns."
-    ),
-    # Attach errors
-    "AttachError": (
-        "Verify the database file path is correct and accessible. "
-        "For DuckDB files, ensure the file exists and is not corrupted. "
-        "Check file permissions if access is denied."
-    ),
-    # Query errors
-    "QueryExecutionError": (
-        "The SQL query failed to execute. This may be due to syntax errors, missing permissions, "
-        "or database-specific issues. Use `--verbose` for more details."
-    ),
-    # SQL injection
-    "SQLInjectionError": (
-        "Input contains potentially unsafe characters. "
-        "Table and column names should only contain alphanumeric characters, underscores, and dots."
-    ),
-    # Connection errors
-    "ConnectionError": (
-        "Unable to connect to the database. Verify connection credentials and network access. "
-        "For Snowflake, check that the account identifier, warehouse, and role are correct."
-    ),
-    # Authentication errors
-    "AuthenticationError": (
-        "Authentication failed. Check your credentials and ensure they are correctly configured. "
-        "For Snowflake, verify your connection profile in ~/.snowflake/connections.toml or environment variables."
-    ),
-    # Import errors
-    "ImportError": (
-        "Required optional dependency is not installed. For Snowflake support, run: pip install 'quack-diff[snowflake]'"
-    ),
-    # Generic database error
-    "DatabaseError": (
-        "A database error occurred. Check the error details for more information. "
-        "Try running with `--verbose` for additional debugging output."
-    ),
-    # Value errors
-    "ValueError": (
-        "Invalid input value. Check that all provided arguments are in the correct format. "
-        "Use `--help` to see expected argument formats."
-    ),
-    # File not found
-    "FileNotFoundError": (
-        "The specified file does not exist. Verify the file path is correct "
-        "and the file is accessible from the current directory."
-    ),
-    # Permission errors
-    "PermissionError": (
-        "Permission denied when accessing the file or resource. Check file permissions and ensure you have read access."
-    ),
-    # Timeout errors
-    "TimeoutError": (
-        "The operation timed out. This may be due to large data volumes or slow network. "
-        "Consider using `--limit` to reduce the result set, or check your database connection."
-    ),
-}
+# Mapping of error types to recovery suggestions (read-only)
+ERROR_RECOVERY_SUGGESTIONS: Mapping[str, str] = MappingProxyType(
+    {
+        # Table errors
+        "TableNotFoundError": (
+            "Check that the table name is correct and fully qualified (database.schema.table). "
+            "Verify the table exists using `SHOW TABLES` or your database's catalog."
+        ),
+        # Key column errors
+        "KeyColumnError": (
+            "Ensure the key column exists in both tables. "
+            "Use `--verbose` to see available columns, or run `quack-diff schema` to compare schemas first."
+        ),
+        # Schema errors
+        "SchemaError": (
+            "Tables may have incompatible schemas. Run `quack-diff schema --source <source> --target <target>` "
+            "to see detailed schema differences. Consider using `--columns` to compare specific columns."
+        ),
+        # Attach errors
+        "AttachError": (
+            "Verify the database file path is correct and accessible. "
+            "For DuckDB files, ensure the file exists and is not corrupted. "
+            "Check file permissions if access is denied."
+        ),
+        # Query errors
+        "QueryExecutionError": (
+            "The SQL query failed to execute. This may be due to syntax errors, missing permissions, "
+            "or database-specific issues. Use `--verbose` for more details."
+        ),
+        # SQL injection
+        "SQLInjectionError": (
+            "Input contains potentially unsafe characters. "
+            "Table and column names should only contain alphanumeric characters, underscores, and dots."
+        ),
+        # Connection errors
+        "ConnectionError": (
+            "Unable to connect to the database. Verify connection credentials and network access. "
+            "For Snowflake, check that the account identifier, warehouse, and role are correct."
+        ),
+        # Authentication errors
+        "AuthenticationError": (
+            "Authentication failed. Check your credentials and ensure they are correctly configured. "
+            "For Snowflake, verify your connection profile in ~/.snowflake/connections.toml or environment variables."
+        ),
+        # Import errors
+        "ImportError": (
+            "Required optional dependency is not installed. "
+            "For Snowflake support, run: pip install 'quack-diff[snowflake]'"
+        ),
+        # Generic database error
+        "DatabaseError": (
+            "A database error occurred. Check the error details for more information. "
+            "Try running with `--verbose` for additional debugging output."
+        ),
+        # Value errors
+        "ValueError": (
+            "Invalid input value. Check that all provided arguments are in the correct format. "
+            "Use `--help` to see expected argument formats."
+        ),
+        # File not found
+        "FileNotFoundError": (
+            "The specified file does not exist. Verify the file path is correct "
+            "and the file is accessible from the current directory."
+        ),
+        # Permission errors
+        "PermissionError": (
+            "Permission denied when accessing the file or resource. "
+            "Check file permissions and ensure you have read access."
+        ),
+        # Timeout errors
+        "TimeoutError": (
+            "The operation timed out. This may be due to large data volumes or slow network. "
+            "Consider using `--limit` to reduce the result set, or check your database connection."
+        ),
+    }
+)
+
+# Error message prefixes by exception type, resolved along the exception's MRO
+# so subclasses fall back to their closest listed base class (read-only)
+ERROR_PREFIXES: Mapping[type[BaseException], str] = MappingProxyType(
+    {
+        TableNotFoundError: "Table not found",
+        KeyColumnError: "Key column error",
+        SchemaError: "Schema error",
+        AttachError: "Database attach error",
+        QueryExecutionError: "Query execution error",
+        SQLInjectionError: "Invalid input",
+        DatabaseError: "Database error",
+        ValueError: "Invalid value",
+    }
+)
+
+# Marks exceptions without a ``details`` attribute
+_NO_DETAILS = object()
 
 
 def get_recovery_suggestion(error_type: str) -> str | None:
@@ -105,6 +139,36 @@ def get_recovery_suggestion(error_type: str) -> str | None:
     return ERROR_RECOVERY_SUGGESTIONS.get(error_type)
 
 
+def error_prefix(exception: BaseException) -> str:
+    """Return the message prefix for an exception, e.g. "Table not found".
+
+    Args:
+        exception: The exception being reported
+
+    Returns:
+        Prefix for the most specific type in :data:`ERROR_PREFIXES`, or
+        "Unexpected error"
+    """
+    return _error_prefix_for_type(type(exception))
+
+
+@lru_cache(maxsize=32)
+def _error_prefix_for_type(exc_type: type[BaseException]) -> str:
+    """Resolve the error prefix for an exception type along its MRO.
+
+    Args:
+        exc_type: Exception class
+
+    Returns:
+        Prefix of the closest listed base class, or "Unexpected error"
+    """
+    for cls in exc_type.__mro__:
+        prefix = ERROR_PREFIXES.get(cls)
+        if prefix is not None:
+            return prefix
+    return "Unexpected error"
+
+
 def get_error_info(
     exception: Exception,
     default_message: str | None = None,
@@ -123,15 +187,14 @@ def get_error_info(
     # Extract message
     message = str(exception) or default_message or "An error occurred"
 
-    # Extract details if available
-    details = None
-    if hasattr(exception, "details"):
-        details = exception.details
-    elif hasattr(exception, "__cause__") and exception.__cause__:
-        details = str(exception.__cause__)
+    # Extract details if available, falling back to the chained cause
+    details = getattr(exception, "details", _NO_DETAILS)
+    if details is _NO_DETAILS:
+        cause = exception.__cause__
+        details = str(cause) if cause else None
 
     # Get recovery suggestion
-    recovery_suggestion = get_recovery_suggestion(error_type)
+    recovery_suggestion = ERROR_RECOVERY_SUGGESTIONS.get(error_type)
 
     return ErrorInfo(
         error_type=error_type,
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from rich import box
+from rich.console import Group, NewLine
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -14,8 +16,26 @@ from quack_diff.cli.console import console
 from quack_diff.core.differ import CountResult, DiffType
 
 if TYPE_CHECKING:
+    from rich.console import RenderableType
+
     from quack_diff.core.differ import DiffResult, SchemaComparisonResult, Threshold
 
+# Constant cells reused across rows and calls; rendering never mutates a Text
+_MODIFIED_TEXT = Text("MODIFIED", style="modified")
+_DIFF_TYPE_TEXT = {
+    DiffType.ADDED: Text("ADDED", style="added"),
+    DiffType.REMOVED: Text("REMOVED", style="removed"),
+    DiffType.MODIFIED: _MODIFIED_TEXT,
+}
+_OK_TEXT = Text("OK", style="success")
+_TYPE_MISMATCH_TEXT = Text("Type Mismatch", style="warning")
+_SOURCE_ONLY_TEXT = Text("Source Only", style="removed")
+_TARGET_ONLY_TEXT = Text("Target Only", style="added")
+_MUTED_DASH_TEXT = Text("-", style="muted")
+_MISSING_VALUE_TEXT = Text("-", style="dim black italic")
+_MATCH_TEXT = Text("MATCH", style="success")
+_MISMATCH_TEXT = Text("MISMATCH", style="error")
+
 
 @dataclass
 class SnowflakeConnectionInfo:
@@ -33,6 +53,20 @@ class SnowflakeConnectionInfo:
     connection_name: str | None = None
 
 
+# (row label, SnowflakeConnectionInfo attribute) for format_snowflake_connections;
+# "Profile" is the connections.toml entry, if one was used
+_CONNECTION_FIELDS = (
+    ("Profile", "connection_name"),
+    ("Account", "account"),
+    ("User", "user"),
+    ("Database", "database"),
+    ("Schema", "schema"),
+    ("Warehouse", "warehouse"),
+    ("Role", "role"),
+    ("Authenticator", "authenticator"),
+)
+
+
 def format_diff_summary(
     result: DiffResult,
     source_display_name: str | None = None,
@@ -145,21 +179,10 @@ def format_diff_table(result: DiffResult, max_rows: int = 50) -> Table | None:
     table.add_column("Source Hash", style="muted", overflow="fold")
     table.add_column("Target Hash", style="muted", overflow="fold")
 
-    for idx, diff in enumerate(result.differences):
-        if idx >= max_rows:
-            break
-
-        # Format diff type with color
-        if diff.diff_type == DiffType.ADDED:
-            type_text = Text("ADDED", style="added")
-        elif diff.diff_type == DiffType.REMOVED:
-            type_text = Text("REMOVED", style="removed")
-        else:
-            type_text = Text("MODIFIED", style="modified")
-
+    for diff in islice(result.differences, max_rows):
         table.add_row(
             str(diff.key),
-            type_text,
+            _DIFF_TYPE_TEXT.get(diff.diff_type, _MODIFIED_TEXT),
             diff.source_hash or "-",
             diff.target_hash or "-",
         )
@@ -196,13 +219,11 @@ def format_schema_comparison(schema: SchemaComparisonResult) -> Panel:
 
     # Show matching columns
     for col_name in sorted(schema.matching_columns):
-        source_col = source_by_name.get(col_name.lower())
-        target_col = target_by_name.get(col_name.lower())
+        name_lc = col_name.lower()
+        source_col = source_by_name.get(name_lc)
+        target_col = target_by_name.get(name_lc)
 
-        if col_name in schema.type_mismatches:
-            status = Text("Type Mismatch", style="warning")
-        else:
-            status = Text("OK", style="success")
+        status = _TYPE_MISMATCH_TEXT if col_name in schema.type_mismatches else _OK_TEXT
 
         table.add_row(
             col_name,
@@ -217,8 +238,8 @@ def format_schema_comparison(schema: SchemaComparisonResult) -> Panel:
         table.add_row(
             col_name,
             source_col.data_type if source_col else "-",
-            Text("-", style="muted"),
-            Text("Source Only", style="removed"),
+            _MUTED_DASH_TEXT,
+            _SOURCE_ONLY_TEXT,
         )
 
     # Show target-only columns
@@ -226,9 +247,9 @@ def format_schema_comparison(schema: SchemaComparisonResult) -> Panel:
         target_col = target_by_name.get(col_name.lower())
         table.add_row(
             col_name,
-            Text("-", style="muted"),
+            _MUTED_DASH_TEXT,
             target_col.data_type if target_col else "-",
-            Text("Target Only", style="added"),
+            _TARGET_ONLY_TEXT,
         )
 
     title = "Schema Comparison"
@@ -252,22 +273,21 @@ def print_diff_result(
         target_display_name: Optional display name for target table
     """
     # Always show summary
-    console.print()
-    console.print(format_diff_summary(result, source_display_name, target_display_name))
+    parts: list[RenderableType] = [NewLine(), format_diff_summary(result, source_display_name, target_display_name)]
 
     # Show schema comparison if verbose or there are issues
     if verbose or not result.schema_comparison.is_identical:
-        console.print()
-        console.print(format_schema_comparison(result.schema_comparison))
+        parts += [NewLine(), format_schema_comparison(result.schema_comparison)]
 
     # Show diff table if there are differences
     if result.total_differences > 0:
         diff_table = format_diff_table(result)
         if diff_table:
-            console.print()
-            console.print(diff_table)
+            parts += [NewLine(), diff_table]
 
-    console.print()
+    parts.append(NewLine())
+    # One print call: a single render pass and write for the whole result
+    console.print(Group(*parts))
 
 
 def print_schema_result(schema: SchemaComparisonResult) -> None:
@@ -276,19 +296,15 @@ def print_schema_result(schema: SchemaComparisonResult) -> None:
     Args:
         schema: SchemaComparisonResult to print
     """
-    console.print()
-    console.print(format_schema_comparison(schema))
-    console.print()
-
     # Print summary
     if schema.is_identical:
-        console.print("[success]Schemas are identical[/success]")
+        summary = "[success]Schemas are identical[/success]"
     elif schema.is_compatible:
-        console.print("[warning]Schemas are compatible but not identical[/warning]")
+        summary = "[warning]Schemas are compatible but not identical[/warning]"
     else:
-        console.print("[error]Schemas are not compatible[/error]")
+        summary = "[error]Schemas are not compatible[/error]"
 
-    console.print()
+    console.print(Group(NewLine(), format_schema_comparison(schema), NewLine(), summary, NewLine()))
 
 
 def format_snowflake_connections(
@@ -319,40 +335,11 @@ def format_snowflake_connections(
     # Helper to format values (show dash for missing values)
     def format_value(value: str | None) -> Text | str:
         if value is None:
-            return Text("-", style="dim black italic")
+            return _MISSING_VALUE_TEXT
         return Text(str(value), style="black")
 
-    # Connection name (if using connections.toml)
-    values = [format_value(conn.connection_name) for conn in connections]
-    table.add_row("Profile", *values)
-
-    # Account
-    values = [format_value(conn.account) for conn in connections]
-    table.add_row("Account", *values)
-
-    # User
-    values = [format_value(conn.user) for conn in connections]
-    table.add_row("User", *values)
-
-    # Database
-    values = [format_value(conn.database) for conn in connections]
-    table.add_row("Database", *values)
-
-    # Schema
-    values = [format_value(conn.schema) for conn in connections]
-    table.add_row("Schema", *values)
-
-    # Warehouse
-    values = [format_value(conn.warehouse) for conn in connections]
-    table.add_row("Warehouse", *values)
-
-    # Role
-    values = [format_value(conn.role) for conn in connections]
-    table.add_row("Role", *values)
-
-    # Authenticator
-    values = [format_value(conn.authenticator) for conn in connections]
-    table.add_row("Authenticator", *values)
+    for label, attr in _CONNECTION_FIELDS:
+        table.add_row(label, *(format_value(getattr(conn, attr)) for conn in connections))
 
     # Table name
     values = [Text(conn.table_name, style="black") for conn in connections]
@@ -370,9 +357,7 @@ def print_snowflake_connections(connections: list[SnowflakeConnectionInfo]) -> N
     if not connections:
         return
 
-    console.print()
-    console.print(format_snowflake_connections(connections))
-    console.print()
+    console.print(Group(NewLine(), format_snowflake_connections(connections), NewLine()))
 
 
 def _metric_status(
@@ -382,10 +367,10 @@ def _metric_status(
 ) -> Text:
     """Return a styled status label for a single metric (count or sum)."""
     if exact:
-        return Text("MATCH", style="success")
+        return _MATCH_TEXT
     if within and threshold is not None:
         return Text(f"PASS (within {threshold})", style="success")
-    return Text("MISMATCH", style="error")
+    return _MISMATCH_TEXT
 
 
 def format_count_summary(
@@ -436,7 +421,7 @@ def format_count_summary(
         status_row.append(sum_status)
     table.add_row(*status_row)
 
-    global_status = Text("MATCH", style="success") if result.is_match else Text("MISMATCH", style="error")
+    global_status = _MATCH_TEXT if result.is_match else _MISMATCH_TEXT
     global_row: list[str | Text] = ["Status", global_status]
     if has_sum:
         global_row.append("")
@@ -465,6 +450,4 @@ def print_count_result(
         result: CountResult to print
         display_name_map: Optional map from resolved table name to display name
     """
-    console.print()
-    console.print(format_count_summary(result, display_name_map))
-    console.print()
+    console.print(Group(NewLine(), format_count_summary(result, display_name_map), NewLine()))
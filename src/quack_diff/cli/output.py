@@ -3,15 +3,36 @@
 from __future__ import annotations
 
 import json
+import math
+import re
 import sys
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import UTC, datetime
 from enum import Enum
+from functools import cache
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install quack-diff[fast-json])
+    orjson = None
+
 if TYPE_CHECKING:
     from quack_diff.core.differ import CountResult, DiffResult, SchemaComparisonResult
 
+# Characters json.dumps escapes beyond orjson: everything outside printable
+# ASCII that orjson leaves as-is (control characters are escaped by both)
+_ESCAPE_RE = re.compile(r"[^\x00-\x7e]")
+
+# orjson options matching the stdlib path in _dumps(): datetimes and
+# dataclasses go through default=str rather than orjson's native encoding
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
 
 class OutputFormat(str, Enum):
     """Supported output formats."""
@@ -67,6 +88,7 @@ class JSONAttachOutput:
     meta: JSONOutputMeta
     database: dict[str, Any]
     tables: list[str]
+    truncated: bool = False
     error: dict[str, Any] | None = None
 
 
@@ -99,8 +121,29 @@ class JSONCountOutput:
     sum_threshold: str | None = None
 
 
+def _as_dict(output: Any) -> dict[str, Any]:
+    """Convert an output dataclass to a dict.
+
+    Unlike :func:`dataclasses.asdict`, field values are not deep-copied:
+    only nested dataclasses (the meta block) become new dicts, while the
+    result's own lists and dicts are referenced as-is for serialization.
+
+    Args:
+        output: JSON output dataclass instance
+
+    Returns:
+        Dictionary suitable for JSON serialization
+    """
+    data: dict[str, Any] = {}
+    for f in fields(output):
+        value = getattr(output, f.name)
+        data[f.name] = _as_dict(value) if is_dataclass(value) else value
+    return data
+
+
+@cache
 def get_version() -> str:
-    """Get quack-diff version."""
+    """Get quack-diff version (resolved once per process)."""
     try:
         from quack_diff import __version__
 
@@ -174,7 +217,7 @@ def format_diff_result_json(
                     "source_hash": d.source_hash,
                     "target_hash": d.target_hash,
                 }
-                for d in result.differences[:100]  # Limit to first 100 for JSON
+                for d in islice(result.differences, 100)  # Limit to first 100 for JSON
             ],
         },
     )
@@ -186,7 +229,7 @@ def format_diff_result_json(
             "is_within_threshold": result.is_within_threshold,
         }
 
-    return asdict(output)
+    return _as_dict(output)
 
 
 def format_schema_result_json(
@@ -242,7 +285,7 @@ def format_schema_result_json(
         },
     )
 
-    return asdict(output)
+    return _as_dict(output)
 
 
 def format_count_result_json(
@@ -297,13 +340,14 @@ def format_count_result_json(
         sum_within_threshold=result.sum_within_threshold,
         sum_threshold=str(result.sum_threshold) if result.sum_threshold else None,
     )
-    return asdict(output)
+    return _as_dict(output)
 
 
 def format_attach_result_json(
     alias: str,
     path: str,
     tables: list[str],
+    truncated: bool = False,
     duration_seconds: float | None = None,
 ) -> dict[str, Any]:
     """Format attach command result as JSON.
@@ -312,6 +356,7 @@ def format_attach_result_json(
         alias: Database alias
         path: Database path
         tables: List of table names
+        truncated: Whether the table list was cut off by --max-tables
         duration_seconds: Optional execution duration
 
     Returns:
@@ -329,9 +374,10 @@ def format_attach_result_json(
             "path": path,
         },
         tables=tables,
+        truncated=truncated,
     )
 
-    return asdict(output)
+    return _as_dict(output)
 
 
 def format_error_json(
@@ -364,15 +410,82 @@ def format_error_json(
         },
     )
 
-    return asdict(output)
+    return _as_dict(output)
 
 
 def print_json(data: dict[str, Any], file: Any = None) -> None:
     """Print JSON output to stdout or specified file.
 
+    Uses orjson when it is installed, which is several times faster on large
+    diff results, and falls back to the standard library otherwise (or for
+    values orjson cannot encode, such as integers beyond 64 bits).
+
     Args:
-        data: Dictionary to serialize as JSON
+        data: Dictionary to serialize as JSON (NaN and infinite floats are
+            written, and replaced in *data*, as null)
         file: Optional file handle (defaults to stdout)
     """
-    output = json.dumps(data, indent=2, default=str)
+    output = _dumps(data)
     print(output, file=file or sys.stdout)
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Serialize data as indented, ASCII-only JSON.
+
+    Both backends produce the same text: non-ASCII characters are escaped
+    as ``\\uXXXX`` and NaN/Infinity (not valid JSON) are written as null.
+
+    Args:
+        data: Dictionary to serialize (non-finite floats in it are replaced
+            with None in place)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            output = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+        else:
+            # orjson writes UTF-8; escape it the way json.dumps does by default
+            return _ESCAPE_RE.sub(_escape_char, output)
+    try:
+        return json.dumps(data, indent=2, default=str, allow_nan=False)
+    except ValueError:
+        # Only payloads holding NaN/Infinity pay for the extra pass
+        return json.dumps(_drop_non_finite(data), indent=2, default=str)
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    """Return the ``\\uXXXX`` escape json.dumps uses for a character."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def _drop_non_finite(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, mutating containers in place.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        *value* itself, or its replacement for a float (or a tuple, which is
+        returned as a list since JSON has no tuples)
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, float | dict | list | tuple):
+                value[key] = _drop_non_finite(item)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, float | dict | list | tuple):
+                value[i] = _drop_non_finite(item)
+    elif isinstance(value, tuple):
+        return _drop_non_finite(list(value))
+    return value
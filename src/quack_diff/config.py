@@ -7,8 +7,11 @@ Supports configuration via:
 - CLI arguments (highest priority)
 """
 
+import copy
 import logging
+import os
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +21,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Default path for Snowflake connections.toml
 SNOWFLAKE_CONNECTIONS_PATH = Path.home() / ".snowflake" / "connections.toml"
 
@@ -348,8 +354,7 @@ class Settings(BaseSettings):
         if config_file is not None:
             config_path = Path(config_file)
             if config_path.exists():
-                with open(config_path) as f:
-                    yaml_config = yaml.safe_load(f) or {}
+                yaml_config = _read_yaml_config(config_path)
 
                 # Merge YAML config with environment/CLI config
                 # Environment variables take precedence
@@ -360,13 +365,72 @@ class Settings(BaseSettings):
         return data
 
 
+def _read_yaml_config(config_path: Path) -> dict[str, Any]:
+    """Read a YAML config file, reusing the parse while the file is unchanged.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Parsed configuration (a fresh copy the caller may modify)
+    """
+    stat = config_path.stat()
+    parsed = _parse_yaml_config(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(parsed)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_config(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML config file, memoized per (path, mtime, size).
+
+    Args:
+        path_str: Resolved absolute path to the YAML configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed configuration (shared; callers must not modify it)
+    """
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 # Global settings instance (lazy loaded)
 _settings: Settings | None = None
 
 
+def _settings_environment() -> tuple[tuple[str, str], ...]:
+    """Return the ``QUACK_DIFF_*`` environment variables, which feed Settings."""
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("QUACK_DIFF_")))
+
+
+@lru_cache(maxsize=8)
+def _cached_get_settings(path_str: str, mtime_ns: int, environment: tuple[tuple[str, str], ...]) -> Settings:
+    """Build settings for a config file, memoized per (path, mtime, environment).
+
+    Including the modification time and the ``QUACK_DIFF_*`` environment in
+    the cache key means edits to the config file and changed variables are
+    picked up automatically.
+
+    Args:
+        path_str: Resolved absolute path to the YAML configuration file
+        mtime_ns: Modification time of the configuration file in nanoseconds
+        environment: Result of :func:`_settings_environment`
+
+    Returns:
+        Settings instance (shared; callers must not modify it)
+    """
+    return Settings(config_file=Path(path_str))
+
+
 def get_settings(config_file: Path | None = None, **overrides: Any) -> Settings:
     """Get or create the settings instance.
 
+    Settings loaded from an explicit config file (without overrides) are
+    cached per resolved path, modification time and ``QUACK_DIFF_*``
+    environment, so repeated calls within the same process skip YAML parsing
+    and validation. Each call gets its own copy of the cached settings.
+
     Args:
         config_file: Optional path to YAML configuration file
         **overrides: Additional settings to override
@@ -376,6 +440,16 @@ def get_settings(config_file: Path | None = None, **overrides: Any) -> Settings:
     """
     global _settings
 
+    if config_file is not None and not overrides:
+        resolved = Path(config_file).resolve()
+        try:
+            mtime_ns = resolved.stat().st_mtime_ns
+        except OSError:
+            pass
+        else:
+            _settings = _cached_get_settings(str(resolved), mtime_ns, _settings_environment()).model_copy(deep=True)
+            return _settings
+
     if _settings is None or config_file is not None or overrides:
         settings_data: dict[str, Any] = {}
         if config_file:
@@ -386,7 +460,61 @@ def get_settings(config_file: Path | None = None, **overrides: Any) -> Settings:
     return _settings
 
 
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of *path*, or None if it cannot be read."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=16)
+def _cached_snowflake_config(
+    connection_name: str,
+    connections_stamp: tuple[int, int] | None,
+    environment: tuple[tuple[str, str], ...],
+) -> SnowflakeConfig:
+    """Build a SnowflakeConfig for a profile, memoized per (name, file, environment).
+
+    Args:
+        connection_name: Connection profile from connections.toml
+        connections_stamp: Result of :func:`_file_stamp` for connections.toml
+        environment: Result of :func:`_settings_environment`
+
+    Returns:
+        SnowflakeConfig instance (shared; callers must not modify it)
+    """
+    return SnowflakeConfig(connection_name=connection_name)
+
+
+def get_snowflake_config(connection_name: str) -> SnowflakeConfig:
+    """Get the SnowflakeConfig for a connections.toml profile.
+
+    Like :func:`get_settings`, configs are cached per ``QUACK_DIFF_*``
+    environment and connections.toml modification time, so every table
+    behind one profile shares a single parse while edits are still picked
+    up. Each call gets its own copy of the cached config.
+
+    Args:
+        connection_name: Connection profile from connections.toml
+
+    Returns:
+        SnowflakeConfig instance
+    """
+    environment = _settings_environment()
+    connections_file = next(
+        (Path(v) for k, v in environment if k.upper() == "QUACK_DIFF_SNOWFLAKE_CONNECTIONS_FILE"),
+        SNOWFLAKE_CONNECTIONS_PATH,
+    )
+    config = _cached_snowflake_config(connection_name, _file_stamp(connections_file), environment)
+    return config.model_copy(deep=True)
+
+
 def reset_settings() -> None:
     """Reset the global settings instance (useful for testing)."""
     global _settings
     _settings = None
+    _cached_get_settings.cache_clear()
+    _cached_snowflake_config.cache_clear()
+    _parse_yaml_config.cache_clear()
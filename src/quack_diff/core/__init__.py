@@ -1,7 +1,30 @@
 """Core diffing engine and database connectivity."""
 
-from quack_diff.core.connector import DuckDBConnector
-from quack_diff.core.differ import DataDiffer
-from quack_diff.core.query_builder import QueryBuilder
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from quack_diff.core.connector import DuckDBConnector
+    from quack_diff.core.differ import DataDiffer
+    from quack_diff.core.query_builder import QueryBuilder
+
+# Exports resolved on first access so importing a light submodule such as
+# quack_diff.core.sql_utils does not pull in DuckDB
+_LAZY_EXPORTS = {
+    "DuckDBConnector": "quack_diff.core.connector",
+    "DataDiffer": "quack_diff.core.differ",
+    "QueryBuilder": "quack_diff.core.query_builder",
+}
 
 __all__ = ["DuckDBConnector", "DataDiffer", "QueryBuilder"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
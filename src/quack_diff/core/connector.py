@@ -6,8 +6,10 @@ databases like Snowflake using native connectors.
 
 from __future__ import annotations
 
+import itertools
 import logging
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
@@ -31,6 +33,33 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _widened_arrow_schema(schema: Any) -> Any:
+    """Widen numeric fields so every Arrow batch of a result fits one schema.
+
+    Snowflake sizes integer columns per batch (an ``int8`` batch can be
+    followed by one holding ``10**10``) and decimal precision likewise, so the
+    first batch's schema is only a lower bound. Integers are widened to
+    ``int64`` and decimals to ``decimal128(38, scale)``, the widest types
+    Snowflake returns for those columns.
+
+    Args:
+        schema: ``pyarrow.Schema`` of the first batch
+
+    Returns:
+        Schema that all later batches can be cast to without overflow
+    """
+    import pyarrow as pa
+
+    fields = []
+    for schema_field in schema:
+        if pa.types.is_integer(schema_field.type):
+            schema_field = schema_field.with_type(pa.int64())
+        elif pa.types.is_decimal128(schema_field.type):
+            schema_field = schema_field.with_type(pa.decimal128(38, schema_field.type.scale))
+        fields.append(schema_field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
 class DatabaseType(str, Enum):
     """Supported database types for attachment."""
 
@@ -84,6 +113,14 @@ class DuckDBConnector:
         self._settings = settings
         self._connection: duckdb.DuckDBPyConnection | None = None
         self._attached_databases: dict[str, AttachedDatabase] = {}
+        # Guards the shared DuckDB connection (lazy creation, cursor creation
+        # and materialized writes) and the attached-database registry when
+        # tables are pulled or databases attached on multiple threads
+        self._write_lock = threading.Lock()
+        # Open Snowflake sessions keyed by connection parameters, so pulls and
+        # queries against the same account reuse one authenticated session
+        self._sf_sessions: dict[tuple[tuple[str, Any], ...], Any] = {}
+        self._sf_session_lock = threading.Lock()
 
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
@@ -97,7 +134,12 @@ class DuckDBConnector:
         return self._connection
 
     def close(self) -> None:
-        """Close the DuckDB connection."""
+        """Close the DuckDB connection and any open Snowflake sessions."""
+        with self._sf_session_lock:
+            for sf_conn in self._sf_sessions.values():
+                sf_conn.close()
+            self._sf_sessions.clear()
+
         if self._connection is not None:
             self._connection.close()
             self._connection = None
@@ -144,18 +186,22 @@ class DuckDBConnector:
             )
 
         # Check if database is already attached with the same name
-        if sanitized_name in self._attached_databases:
-            existing = self._attached_databases[sanitized_name]
-            existing_path = existing.metadata.get("path", "unknown")
-            if existing_path == sanitized_path:
-                logger.debug(f"Database '{sanitized_name}' already attached from '{sanitized_path}'")
-                return existing
-            raise AttachError(
-                f"Database alias '{sanitized_name}' is already in use",
-                path=sanitized_path,
-                alias=sanitized_name,
-                details=f"Already attached from: {existing_path}",
-            )
+        with self._write_lock:
+            if sanitized_name in self._attached_databases:
+                existing = self._attached_databases[sanitized_name]
+                existing_path = existing.metadata.get("path", "unknown")
+                if existing_path == sanitized_path:
+                    logger.debug(f"Database '{sanitized_name}' already attached from '{sanitized_path}'")
+                    return existing
+                raise AttachError(
+                    f"Database alias '{sanitized_name}' is already in use",
+                    path=sanitized_path,
+                    alias=sanitized_name,
+                    details=f"Already attached from: {existing_path}",
+                )
+            # ATTACH is visible to every connection of the database instance,
+            # so a per-call cursor lets several files be opened concurrently
+            cursor = self.connection.cursor()
 
         mode = "READ_ONLY" if read_only else "READ_WRITE"
         logger.info(f"Attaching DuckDB database '{sanitized_path}' as '{sanitized_name}'")
@@ -163,7 +209,8 @@ class DuckDBConnector:
         try:
             # Use parameterized query where possible, but ATTACH requires identifier
             # Since we've sanitized the inputs, this is safe
-            self.connection.execute(f"ATTACH '{sanitized_path}' AS {sanitized_name} ({mode})")
+            with cursor:
+                cursor.execute(f"ATTACH '{sanitized_path}' AS {sanitized_name} ({mode})")
         except duckdb.IOException as e:
             error_msg = str(e).lower()
             if "permission" in error_msg or "access" in error_msg:
@@ -200,7 +247,8 @@ class DuckDBConnector:
             attached=True,
             metadata={"path": sanitized_path, "read_only": read_only},
         )
-        self._attached_databases[sanitized_name] = attached
+        with self._write_lock:
+            self._attached_databases[sanitized_name] = attached
         return attached
 
     def detach(self, name: str) -> None:
@@ -304,6 +352,30 @@ class DuckDBConnector:
         result = self.execute(query, params)
         return result.fetchall()
 
+    def execute_iter(
+        self,
+        query: str,
+        params: list[Any] | None = None,
+        batch_size: int = 1024,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Execute a query and stream results in batches.
+
+        Rows are fetched with ``fetchmany`` so at most ``batch_size`` rows
+        are materialized at a time. The query runs when iteration starts;
+        do not issue other queries on the connection until it is exhausted.
+
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters
+            batch_size: Number of rows fetched per round-trip
+
+        Yields:
+            Result tuples
+        """
+        result = self.execute(query, params)
+        while rows := result.fetchmany(batch_size):
+            yield from rows
+
     def execute_fetchone(self, query: str, params: list[Any] | None = None) -> tuple[Any, ...] | None:
         """Execute a query and fetch one result.
 
@@ -434,7 +506,7 @@ class DuckDBConnector:
             ValueError: If required parameters are missing
         """
         try:
-            import snowflake.connector
+            import snowflake.connector  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "snowflake-connector-python is required for pull_snowflake_table. "
@@ -508,43 +580,86 @@ class DuckDBConnector:
         logger.info(f"Pulling Snowflake table {sanitized_table} to local table {sanitized_local}")
         logger.debug(f"Query: {query}")
 
-        # Connect to Snowflake and fetch data
-        with snowflake.connector.connect(**conn_params) as sf_conn:
-            cursor = sf_conn.cursor()
+        # Fetch data over a (possibly shared) Snowflake session
+        sf_conn = self._snowflake_session(conn_params)
+        cursor = sf_conn.cursor()
+        try:
+            cursor.execute(query)
+
+            # Try streaming Arrow batches first (most efficient): rows go
+            # straight into DuckDB without materializing the full result
             try:
-                cursor.execute(query)
+                arrow_batches = cursor.fetch_arrow_batches()
+                first_batch = next(arrow_batches, None)
+            except Exception as arrow_err:
+                logger.debug(f"Arrow fetch failed, falling back to pandas: {arrow_err}")
+                first_batch = None
+
+            if first_batch is not None:
+                import pyarrow as pa
+
+                schema = _widened_arrow_schema(first_batch.schema)
+                record_batches = (
+                    record_batch
+                    for batch in itertools.chain([first_batch], arrow_batches)
+                    for record_batch in (batch if batch.schema == schema else batch.cast(schema)).to_batches()
+                )
+                reader = pa.RecordBatchReader.from_batches(schema, record_batches)
+
+                # A dedicated DuckDB cursor lets concurrent pulls stream into
+                # their own tables without holding the lock during network I/O
+                with self._write_lock:
+                    duckdb_cursor = self.connection.cursor()
+                with duckdb_cursor:
+                    duckdb_cursor.register("__sf_arrow_stream", reader)
+                    duckdb_cursor.execute(
+                        f"CREATE OR REPLACE TABLE {sanitized_local} AS SELECT * FROM __sf_arrow_stream"
+                    )
+                logger.debug(f"Streamed {sanitized_table} into {sanitized_local} via Arrow batches")
+                return sanitized_local
+
+            # Fallback to pandas
+            try:
+                import pandas  # noqa: F401 - ensures pandas is installed
 
-                # Try Arrow fetch first (most efficient)
-                try:
-                    arrow_table = cursor.fetch_arrow_all()
-                    if arrow_table is not None:
-                        # Use sanitized local table name
-                        self.connection.execute(
-                            f"CREATE OR REPLACE TABLE {sanitized_local} AS SELECT * FROM arrow_table"
-                        )
-                        logger.debug(f"Loaded {arrow_table.num_rows} rows via Arrow")
-                        return sanitized_local
-                except Exception as arrow_err:
-                    logger.debug(f"Arrow fetch failed, falling back to pandas: {arrow_err}")
-
-                # Fallback to pandas
-                try:
-                    import pandas  # noqa: F401 - ensures pandas is installed
-
-                    df = cursor.fetch_pandas_all()
-                    # Use sanitized local table name
+                df = cursor.fetch_pandas_all()
+                # Use sanitized local table name
+                with self._write_lock:
                     self.connection.execute(f"CREATE OR REPLACE TABLE {sanitized_local} AS SELECT * FROM df")
-                    logger.debug(f"Loaded {len(df)} rows via pandas")
-                    return sanitized_local
-                except ImportError as err:
-                    raise ImportError(
-                        "pandas is required for Snowflake data transfer when Arrow fails. "
-                        "Install it with: pip install pandas"
-                    ) from err
-            finally:
-                cursor.close()
+                logger.debug(f"Loaded {len(df)} rows via pandas")
+                return sanitized_local
+            except ImportError as err:
+                raise ImportError(
+                    "pandas is required for Snowflake data transfer when Arrow fails. "
+                    "Install it with: pip install pandas"
+                ) from err
+        finally:
+            cursor.close()
+
+    def _snowflake_session(self, conn_params: dict[str, Any]) -> Any:
+        """Return an open Snowflake connection for the given parameters.
+
+        Sessions are opened lazily and cached on the connector until
+        :meth:`close`, so pulling source and target from the same account
+        authenticates only once. Snowflake connections may be shared across
+        threads, which lets concurrent pulls reuse the same session.
 
-        return sanitized_local
+        Args:
+            conn_params: Parameters for snowflake.connector.connect()
+
+        Returns:
+            An open snowflake.connector connection
+        """
+        import snowflake.connector
+
+        key = tuple(sorted(conn_params.items()))
+        with self._sf_session_lock:
+            sf_conn = self._sf_sessions.get(key)
+            if sf_conn is None:
+                sf_conn = snowflake.connector.connect(**conn_params)
+                self._sf_sessions[key] = sf_conn
+                logger.debug(f"Opened Snowflake session for account {conn_params.get('account')}")
+            return sf_conn
 
     def _build_snowflake_conn_params(
         self,
@@ -611,56 +726,44 @@ class DuckDBConnector:
 
         return conn_params
 
-    def execute_snowflake_scalar(
+    def execute_snowflake_row(
         self,
         query: str,
         config: SnowflakeConfig | None = None,
         database: str | None = None,
-    ) -> Any:
-        """Execute a SQL query on Snowflake and return a single scalar value.
+    ) -> tuple[Any, ...]:
+        """Execute a SQL query on Snowflake and return its first row.
 
-        Useful for running COUNT queries or other aggregations directly on
-        Snowflake without pulling data into DuckDB.
+        Lets callers fetch several aggregates (e.g. COUNT and SUM) in a single
+        round trip instead of one query per value.
 
         Args:
-            query: SQL query that returns exactly one row with one column
+            query: SQL query that returns at least one row
             config: SnowflakeConfig instance (falls back to settings)
             database: Optional database override
 
         Returns:
-            The scalar value from the query result
+            The first row of the query result as a tuple
 
         Raises:
             ImportError: If snowflake-connector-python is not installed
             ValueError: If required credentials are missing
-            QueryExecutionError: If the query fails or returns non-scalar result
+            QueryExecutionError: If the query fails or returns no rows
         """
         import snowflake.connector
 
         conn_params = self._build_snowflake_conn_params(config=config, database=database)
 
-        logger.info(f"Executing Snowflake scalar query: {query[:120]}...")
+        logger.info(f"Executing Snowflake query: {query[:120]}...")
         logger.debug(f"Full query: {query}")
 
         try:
-            with snowflake.connector.connect(**conn_params) as sf_conn:
-                cursor = sf_conn.cursor()
-                try:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
-                    if row is None:
-                        raise QueryExecutionError(
-                            "Snowflake query returned no rows (expected exactly one scalar value)",
-                            query=query,
-                        )
-                    if len(row) != 1:
-                        raise QueryExecutionError(
-                            f"Snowflake query returned {len(row)} columns (expected exactly one)",
-                            query=query,
-                        )
-                    return row[0]
-                finally:
-                    cursor.close()
+            cursor = self._snowflake_session(conn_params).cursor()
+            try:
+                cursor.execute(query)
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
         except snowflake.connector.errors.ProgrammingError as e:
             raise QueryExecutionError(
                 f"Snowflake query failed: {e}",
@@ -668,11 +771,60 @@ class DuckDBConnector:
                 details=str(e),
             ) from e
 
+        if row is None:
+            raise QueryExecutionError("Snowflake query returned no rows", query=query)
+        return tuple(row)
+
+    def execute_snowflake_scalar(
+        self,
+        query: str,
+        config: SnowflakeConfig | None = None,
+        database: str | None = None,
+    ) -> Any:
+        """Execute a SQL query on Snowflake and return a single scalar value.
+
+        Useful for running COUNT queries or other aggregations directly on
+        Snowflake without pulling data into DuckDB.
+
+        Args:
+            query: SQL query that returns exactly one row with one column
+            config: SnowflakeConfig instance (falls back to settings)
+            database: Optional database override
+
+        Returns:
+            The scalar value from the query result
+
+        Raises:
+            ImportError: If snowflake-connector-python is not installed
+            ValueError: If required credentials are missing
+            QueryExecutionError: If the query fails or returns non-scalar result
+        """
+        row = self.execute_snowflake_row(query, config=config, database=database)
+        if len(row) != 1:
+            raise QueryExecutionError(
+                f"Snowflake query returned {len(row)} columns (expected exactly one)",
+                query=query,
+            )
+        return row[0]
+
     @property
     def attached_databases(self) -> dict[str, AttachedDatabase]:
         """Get dictionary of attached databases."""
         return self._attached_databases.copy()
 
+    def is_attached(self, name: str) -> bool:
+        """Check whether a database is attached under the given alias.
+
+        Unlike :attr:`attached_databases`, this does not copy the registry.
+
+        Args:
+            name: Alias of the database
+
+        Returns:
+            True if a database is attached under this alias
+        """
+        return name in self._attached_databases
+
 
 @contextmanager
 def create_connector(
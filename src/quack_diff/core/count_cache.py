@@ -0,0 +1,131 @@
+"""Persistent cache of local count results.
+
+Stores the (count, sum) metrics of tables inside DuckDB database files so
+repeated ``quack-diff count`` runs against unchanged files skip the scans.
+Callers include the stat of the file and of its write-ahead log in every
+key, so any write to the database makes its entries unreachable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Overrides the cache directory (e.g. for CI sandboxes and tests)
+CACHE_DIR_ENV = "QUACK_DIFF_CACHE_DIR"
+
+_CACHE_FILE = "counts.sqlite"
+
+
+def cache_path() -> Path:
+    """Return the location of the count cache database.
+
+    Uses ``$QUACK_DIFF_CACHE_DIR`` when set, otherwise
+    ``$XDG_CACHE_HOME/quack-diff`` (defaulting to ``~/.cache/quack-diff``).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override) / _CACHE_FILE
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    root = Path(xdg) if xdg else Path.home() / ".cache"
+    return root / "quack-diff" / _CACHE_FILE
+
+
+class CountCache:
+    """Handle on the count cache database.
+
+    The database is opened on first use and the one connection serves every
+    lookup and write until :meth:`close`, which also commits the writes. Use
+    it as a context manager around a whole run. If the cache cannot be
+    opened, lookups miss and writes are dropped.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or cache_path()
+        self._conn: sqlite3.Connection | None = None
+        self._unavailable = False
+
+    def __enter__(self) -> CountCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Return the open connection, opening it on first use."""
+        if self._conn is None and not self._unavailable:
+            conn = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=1.0)
+                conn.execute("CREATE TABLE IF NOT EXISTS counts (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Count cache unavailable at {self.path}: {e}")
+                if conn is not None:
+                    conn.close()
+                self._unavailable = True
+            else:
+                self._conn = conn
+        return self._conn
+
+    def get(self, key: tuple) -> tuple[int, int | float | None] | None:
+        """Look up cached metrics.
+
+        Args:
+            key: JSON-serializable cache key
+
+        Returns:
+            (count, sum) if cached, otherwise None
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value FROM counts WHERE key = ?", (json.dumps(key),)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Count cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        count, sum_value = json.loads(row[0])
+        return count, sum_value
+
+    def put(self, key: tuple, metrics: tuple[int, int | float | None]) -> None:
+        """Store metrics in the cache.
+
+        Sums that do not round-trip through JSON (e.g. ``Decimal``) are not
+        cached. Failures are logged and otherwise ignored.
+
+        Args:
+            key: JSON-serializable cache key
+            metrics: (count, sum) to store
+        """
+        if not isinstance(metrics[1], int | float | None):
+            return
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO counts (key, value) VALUES (?, ?)",
+                (json.dumps(key), json.dumps(list(metrics))),
+            )
+        except sqlite3.Error as e:
+            logger.debug(f"Count cache write failed: {e}")
+
+    def close(self) -> None:
+        """Commit pending writes and close the connection."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Count cache write failed: {e}")
+        finally:
+            conn.close()
@@ -16,6 +16,7 @@ from quack_diff.core.adapters.base import Dialect
 from quack_diff.core.connector import DuckDBConnector
 from quack_diff.core.query_builder import QueryBuilder
 from quack_diff.core.sql_utils import (
+    DatabaseError,
     KeyColumnError,
     QueryExecutionError,
     SchemaError,
@@ -246,6 +247,26 @@ class CountResult:
         ref = self.table_counts[0].count
         return all(tc.count == ref for tc in self.table_counts)
 
+    @property
+    def metrics_match(self) -> bool:
+        """True when every table has exactly the reference (count, sum) pair.
+
+        Equivalent to ``count_match and sum_match is not False`` in a single
+        pass; without sums every ``sum_value`` is None and compares equal.
+        """
+        if not self.table_counts:
+            return True
+        first = self.table_counts[0]
+        ref = (first.count, first.sum_value)
+        return all((tc.count, tc.sum_value) == ref for tc in self.table_counts[1:])
+
+    @property
+    def within_threshold(self) -> bool:
+        """True when counts and (if present) sums are within their thresholds."""
+        if self.metrics_match:
+            return True
+        return self.count_within_threshold and self.sum_within_threshold is not False
+
     @property
     def count_within_threshold(self) -> bool:
         """True when all counts are within the configured threshold (or exact)."""
@@ -521,7 +542,7 @@ class DataDiffer:
         if not tables:
             return CountResult(table_counts=[], key_column=key_column, is_match=True)
 
-        table_counts: list[TableCount] = []
+        queries = []
         for table in tables:
             if key_column:
                 query = self.query_builder.build_distinct_count_query(
@@ -534,16 +555,23 @@ class DataDiffer:
                     table=table,
                     dialect=dialect,
                 )
-            try:
-                row = self.connector.execute_fetchone(query)
-                count = row[0] if row else 0
-            except TableNotFoundError as e:
-                raise TableNotFoundError(
-                    table=table,
-                    message=f"Cannot count: table '{table}' does not exist",
-                    details="Verify the table name, schema, and database are correct",
-                ) from e
-            table_counts.append(TableCount(table=table, count=count))
+            queries.append(query)
+
+        # Count every table with one query so the engine plans all scans once
+        table_counts = self._fused_counts(tables, queries) if len(queries) > 1 else None
+        if table_counts is None:
+            table_counts = []
+            for table, query in zip(tables, queries, strict=True):
+                try:
+                    row = self.connector.execute_fetchone(query)
+                    count = row[0] if row else 0
+                except TableNotFoundError as e:
+                    raise TableNotFoundError(
+                        table=table,
+                        message=f"Cannot count: table '{table}' does not exist",
+                        details="Verify the table name, schema, and database are correct",
+                    ) from e
+                table_counts.append(TableCount(table=table, count=count))
 
         reference = table_counts[0].count
         is_match = all(tc.count == reference for tc in table_counts)
@@ -553,6 +581,26 @@ class DataDiffer:
             is_match=is_match,
         )
 
+    def _fused_counts(self, tables: list[str], queries: list[str]) -> list[TableCount] | None:
+        """Run several count queries as scalar subqueries of one SELECT.
+
+        Args:
+            tables: Table names, aligned with *queries*
+            queries: Single-value count queries
+
+        Returns:
+            Per-table counts, or None if the combined query failed (the
+            caller then counts one by one so the error names the table)
+        """
+        fused_query = "SELECT " + ", ".join(f"({query})" for query in queries)
+        try:
+            row = self.connector.execute_fetchone(fused_query)
+        except DatabaseError:
+            return None
+        if row is None:
+            return None
+        return [TableCount(table=table, count=count) for table, count in zip(tables, row, strict=True)]
+
     def _validate_key_column(
         self,
         key_column: str,
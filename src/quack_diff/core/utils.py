@@ -7,6 +7,17 @@ from __future__ import annotations
 
 import re
 
+# "<n> <unit>[s] [ago]", matched case-insensitively against the whole offset
+_OFFSET_RE = re.compile(r"(\d+)\s*(second|minute|hour|day|week)s?(?:\s+ago)?", re.IGNORECASE)
+
+_OFFSET_UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+}
+
 
 def parse_offset_to_seconds(offset: str) -> int:
     """Parse a human-readable time offset to seconds.
@@ -35,26 +46,11 @@ def parse_offset_to_seconds(offset: str) -> int:
         >>> parse_offset_to_seconds("30 seconds")
         30
     """
-    offset_lower = offset.lower().strip()
-
-    # Remove "ago" suffix if present
-    if offset_lower.endswith(" ago"):
-        offset_lower = offset_lower[:-4].strip()
-
-    # Parse number and unit using regex
-    match = re.match(r"(\d+)\s*(second|minute|hour|day|week)s?$", offset_lower)
+    match = _OFFSET_RE.fullmatch(offset.strip())
     if not match:
         raise ValueError(f"Invalid offset format: '{offset}'. Expected format like '5 minutes ago' or '1 hour'")
 
     value = int(match.group(1))
-    unit = match.group(2)
-
-    multipliers = {
-        "second": 1,
-        "minute": 60,
-        "hour": 3600,
-        "day": 86400,
-        "week": 604800,
-    }
+    unit = match.group(2).lower()
 
-    return value * multipliers[unit]
+    return value * _OFFSET_UNIT_SECONDS[unit]
@@ -0,0 +1,307 @@
+"""Tests for the compare CLI command helpers."""
+
+from __future__ import annotations
+
+import threading
+
+from quack_diff.cli.commands.compare import (
+    TableRef,
+    _auto_attach_databases,
+    _classify_table,
+    _describe_snowflake_pulls,
+    _parse_columns,
+    _parse_table_reference,
+    _pull_snowflake_tables,
+    _resolve_sf_connection,
+    _split_time_travel,
+)
+from quack_diff.config import Settings, get_snowflake_config
+from quack_diff.core.connector import DuckDBConnector
+
+
+class _RecordingConnector:
+    """Stand-in connector that records Snowflake pulls instead of running them."""
+
+    def __init__(self) -> None:
+        self.pulls: list[dict] = []
+        self.threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def pull_snowflake_table(self, **kwargs) -> str:
+        with self._lock:
+            self.pulls.append(kwargs)
+            self.threads.add(threading.get_ident())
+        return kwargs["local_name"]
+
+
+class TestParseTableReference:
+    """Tests for _parse_table_reference."""
+
+    def test_snowflake_prefix(self):
+        assert _parse_table_reference("sf.SCHEMA.TABLE") == ("sf", "SCHEMA.TABLE")
+
+    def test_long_snowflake_prefix_is_lowercased(self):
+        assert _parse_table_reference("Snowflake.DB.SCHEMA.TABLE") == ("snowflake", "DB.SCHEMA.TABLE")
+
+    def test_short_alias(self):
+        assert _parse_table_reference("PROD.users") == ("prod", "users")
+
+    def test_long_first_part_is_not_alias(self):
+        assert _parse_table_reference("analytics.users") == (None, "analytics.users")
+
+    def test_file_path_is_not_alias(self):
+        assert _parse_table_reference("data/prod.parquet") == (None, "data/prod.parquet")
+
+    def test_short_file_name_is_not_alias(self):
+        assert _parse_table_reference("data.csv") == (None, "data.csv")
+
+    def test_upper_case_file_suffix_is_not_alias(self):
+        assert _parse_table_reference("x.CSV") == (None, "x.CSV")
+        assert _parse_table_reference("DATA.PARQUET") == (None, "DATA.PARQUET")
+
+    def test_windows_path_is_not_alias(self):
+        assert _parse_table_reference("dir\\prod.parquet") == (None, "dir\\prod.parquet")
+
+    def test_plain_table(self):
+        assert _parse_table_reference("users") == (None, "users")
+
+    def test_repeated_reference_is_cached(self):
+        """Parsing the same reference again is served from the cache."""
+        _parse_table_reference("sf.CACHED.TABLE")
+        hits = _parse_table_reference.cache_info().hits
+        assert _parse_table_reference("sf.CACHED.TABLE") == ("sf", "CACHED.TABLE")
+        assert _parse_table_reference.cache_info().hits == hits + 1
+
+
+class TestParseColumns:
+    """Tests for _parse_columns."""
+
+    def test_none(self):
+        assert _parse_columns(None) is None
+
+    def test_comma_separated(self):
+        assert _parse_columns(["id, name ,email"]) == ["id", "name", "email"]
+
+    def test_repeated_and_mixed(self):
+        assert _parse_columns(["id", "name,email"]) == ["id", "name", "email"]
+
+    def test_empty_entries_dropped(self):
+        assert _parse_columns(["id,,name,"]) == ["id", "name"]
+        assert _parse_columns([" , "]) is None
+
+
+class TestSplitTimeTravel:
+    """Tests for _split_time_travel."""
+
+    def test_none(self):
+        assert _split_time_travel(None) == (None, None)
+
+    def test_offset(self):
+        assert _split_time_travel("5 minutes AGO") == (None, "5 minutes AGO")
+
+    def test_timestamp(self):
+        assert _split_time_travel("2024-01-15 10:30:00") == ("2024-01-15 10:30:00", None)
+
+
+class TestClassifyTable:
+    """Tests for _classify_table."""
+
+    def test_snowflake_prefix(self):
+        ref = _classify_table("sf.SCHEMA.ORDERS", Settings())
+        assert ref == TableRef(
+            raw="sf.SCHEMA.ORDERS", alias="sf", table="SCHEMA.ORDERS", is_snowflake=True, db_config=None
+        )
+
+    def test_file_path(self):
+        ref = _classify_table("data/orders.parquet", Settings())
+        assert ref.alias is None
+        assert ref.is_snowflake is False
+
+    def test_configured_aliases(self):
+        settings = Settings(
+            databases={
+                "prod": {"type": "snowflake", "database": "PROD_DB"},
+                "dev": {"type": "duckdb", "path": "dev.duckdb"},
+            }
+        )
+        prod = _classify_table("prod.users", settings)
+        dev = _classify_table("dev.users", settings)
+
+        assert prod.is_snowflake is True
+        assert prod.db_config == {"type": "snowflake", "database": "PROD_DB"}
+        assert dev.is_snowflake is False
+        assert dev.db_config == {"type": "duckdb", "path": "dev.duckdb"}
+
+    def test_configured_type_is_case_insensitive(self):
+        settings = Settings(databases={"prod": {"type": "Snowflake"}, "dev": {"type": "DUCKDB"}})
+        assert _classify_table("prod.users", settings).is_snowflake is True
+        assert _classify_table("dev.users", settings).is_snowflake is False
+
+    def test_unconfigured_alias_is_not_snowflake(self):
+        ref = _classify_table("loc.users", Settings())
+        assert ref.alias == "loc"
+        assert ref.is_snowflake is False
+        assert ref.db_config is None
+
+
+class TestAutoAttachDatabases:
+    """Tests for _auto_attach_databases."""
+
+    def test_shared_alias_attached_once(self, tmp_path):
+        """Source and target in the same configured DuckDB file attach it once."""
+        import duckdb
+
+        db_path = tmp_path / "dev.duckdb"
+        duckdb.connect(str(db_path)).close()
+        settings = Settings(databases={"dev": {"type": "duckdb", "path": str(db_path)}})
+
+        with DuckDBConnector() as connector:
+            _auto_attach_databases(
+                connector,
+                _classify_table("dev.users", settings),
+                _classify_table("dev.orders", settings),
+            )
+            assert list(connector.attached_databases) == ["dev"]
+
+    def test_snowflake_and_unconfigured_aliases_skipped(self):
+        """Only configured DuckDB aliases are attached."""
+        with DuckDBConnector() as connector:
+            _auto_attach_databases(
+                connector,
+                _classify_table("sf.SCHEMA.USERS", Settings()),
+                _classify_table("loc.users", Settings()),
+            )
+            assert connector.attached_databases == {}
+
+
+class TestDescribeSnowflakePulls:
+    """Tests for _describe_snowflake_pulls."""
+
+    def test_one_line_per_snowflake_endpoint(self):
+        message = _describe_snowflake_pulls(
+            (_classify_table("sf.SCHEMA.ORDERS", Settings()), None, "5 minutes ago"),
+            (_classify_table("data/orders.parquet", Settings()), None, None),
+        )
+        assert message == "Pulling Snowflake table: SCHEMA.ORDERS AT 5 minutes ago"
+
+    def test_both_endpoints(self):
+        message = _describe_snowflake_pulls(
+            (_classify_table("sf.A", Settings()), "2024-01-15 10:30:00", None),
+            (_classify_table("sf.B", Settings()), None, None),
+        )
+        assert message.splitlines() == [
+            "Pulling Snowflake table: A AT 2024-01-15 10:30:00",
+            "Pulling Snowflake table: B",
+        ]
+
+
+class TestResolveSfConnection:
+    """Tests for _resolve_sf_connection."""
+
+    def test_prefix_uses_global_config(self):
+        settings = Settings()
+        ref = _classify_table("sf.SCHEMA.ORDERS", settings)
+        assert _resolve_sf_connection(ref, settings) == (settings.snowflake, None, None)
+
+    def test_alias_overrides(self):
+        settings = Settings(
+            databases={"prod": {"type": "snowflake", "connection_name": "prod_profile", "database": "PROD_DB"}}
+        )
+        config, database, connection_name = _resolve_sf_connection(_classify_table("prod.S.T", settings), settings)
+
+        assert config == get_snowflake_config("prod_profile")
+        assert database == "PROD_DB"
+        assert connection_name == "prod_profile"
+
+
+class TestPullSnowflakeTables:
+    """Tests for _pull_snowflake_tables."""
+
+    def test_same_table_same_time_pulled_once(self):
+        """Identical source and target references share a single pull."""
+        connector = _RecordingConnector()
+        source_local, target_local, infos = _pull_snowflake_tables(
+            connector=connector,
+            settings=Settings(),
+            source_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            target_ref=_classify_table("SF.SCHEMA.ORDERS", Settings()),
+            source_offset="5 minutes ago",
+            target_offset="5 minutes ago",
+        )
+
+        assert source_local == target_local == "__source_pulled"
+        assert len(connector.pulls) == 1
+        assert [info.alias for info in infos] == ["source", "target"]
+
+    def test_both_sides_pulled(self):
+        """Both Snowflake sides are pulled and reported in source/target order."""
+        connector = _RecordingConnector()
+        source_local, target_local, infos = _pull_snowflake_tables(
+            connector=connector,
+            settings=Settings(),
+            source_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            target_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            source_offset="5 minutes ago",
+        )
+
+        assert source_local == "__source_pulled"
+        assert target_local == "__target_pulled"
+        assert [info.alias for info in infos] == ["source", "target"]
+        assert sorted(p["local_name"] for p in connector.pulls) == ["__source_pulled", "__target_pulled"]
+        assert threading.get_ident() not in connector.threads
+
+    def test_order_is_source_then_target_when_source_finishes_last(self):
+        """Connection infos keep source/target order regardless of completion order."""
+        target_done = threading.Event()
+
+        class SlowSourceConnector(_RecordingConnector):
+            def pull_snowflake_table(self, **kwargs) -> str:
+                if kwargs["local_name"] == "__source_pulled":
+                    assert target_done.wait(timeout=5)
+                result = super().pull_snowflake_table(**kwargs)
+                if kwargs["local_name"] == "__target_pulled":
+                    target_done.set()
+                return result
+
+        connector = SlowSourceConnector()
+        _, _, infos = _pull_snowflake_tables(
+            connector=connector,
+            settings=Settings(),
+            source_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            target_ref=_classify_table("sf.SCHEMA.CUSTOMERS", Settings()),
+        )
+
+        assert [p["local_name"] for p in connector.pulls] == ["__target_pulled", "__source_pulled"]
+        assert [(info.alias, info.table_name) for info in infos] == [
+            ("source", "SCHEMA.ORDERS"),
+            ("target", "SCHEMA.CUSTOMERS"),
+        ]
+
+    def test_connection_info_not_collected(self):
+        """Connection details are skipped when not requested."""
+        connector = _RecordingConnector()
+        source_local, target_local, infos = _pull_snowflake_tables(
+            connector=connector,
+            settings=Settings(),
+            source_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            target_ref=_classify_table("sf.SCHEMA.CUSTOMERS", Settings()),
+            collect_connection_info=False,
+        )
+
+        assert (source_local, target_local) == ("__source_pulled", "__target_pulled")
+        assert infos == []
+
+    def test_only_snowflake_side_pulled(self):
+        """A non-Snowflake side is returned unchanged and pulled inline."""
+        connector = _RecordingConnector()
+        source_local, target_local, infos = _pull_snowflake_tables(
+            connector=connector,
+            settings=Settings(),
+            source_ref=_classify_table("sf.SCHEMA.ORDERS", Settings()),
+            target_ref=_classify_table("data/orders.parquet", Settings()),
+        )
+
+        assert source_local == "__source_pulled"
+        assert target_local == "data/orders.parquet"
+        assert [info.alias for info in infos] == ["source"]
+        assert connector.threads == {threading.get_ident()}
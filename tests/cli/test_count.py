@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
 import json
+import os
 import tempfile
+import threading
 from pathlib import Path
 
 import duckdb
@@ -13,14 +16,24 @@ from typer.testing import CliRunner
 from quack_diff.cli.commands.count import (
     TableSpec,
     _build_count_query,
+    _build_metrics_query,
+    _collect_direct_metrics,
+    _is_certain_mismatch,
     _parse_table_spec,
+    _plan_queries,
     _split_table_arg,
 )
 from quack_diff.cli.main import app
 from quack_diff.config import Settings
+from quack_diff.core.connector import DuckDBConnector
+from quack_diff.core.differ import Threshold
+from quack_diff.core.sql_utils import SQLInjectionError
 
 runner = CliRunner()
 
+# The package re-exports the ``count`` command function under the module's name
+count_module = importlib.import_module("quack_diff.cli.commands.count")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -61,6 +74,14 @@ class TestSplitTableArg:
     def test_empty_string(self):
         assert _split_table_arg("") == []
 
+    def test_empty_tokens_dropped(self):
+        assert _split_table_arg("sf.A,,sf.B,") == ["sf.A", "sf.B"]
+
+    @pytest.mark.parametrize("value", ["sf.A[x,y", "sf.A]x", "sf.A[x[y]]"])
+    def test_unbalanced_brackets_raise(self, value):
+        with pytest.raises(ValueError, match="Unbalanced brackets"):
+            _split_table_arg(value)
+
 
 # ---------------------------------------------------------------------------
 # _parse_table_spec
@@ -98,6 +119,7 @@ class TestParseTableSpec:
         assert spec.alias == "loc"
         assert spec.is_snowflake is False
         assert spec.group_by is None
+        assert spec.full_ref == "loc.main.t1"
 
     def test_no_alias(self):
         settings = _make_settings()
@@ -105,6 +127,7 @@ class TestParseTableSpec:
         assert spec.alias is None
         assert spec.table == "my_table"
         assert spec.is_snowflake is False
+        assert spec.full_ref == "my_table"
 
     def test_group_by_whitespace_stripped(self):
         settings = _make_settings()
@@ -116,6 +139,17 @@ class TestParseTableSpec:
         with pytest.raises(ValueError, match="Empty group-by column list"):
             _parse_table_spec("sf.T[]", settings)
 
+    def test_repeated_spec_is_memoized(self):
+        settings = _make_settings(loc={"type": "duckdb", "path": "/tmp/x.duckdb"})
+        first = _parse_table_spec("loc.main.t1[a]", settings)
+        assert _parse_table_spec("loc.main.t1[a]", settings) is first
+
+    def test_new_settings_reclassify_alias(self):
+        spec = _parse_table_spec("mydb.T", _make_settings(mydb={"type": "duckdb", "path": "/tmp/x.duckdb"}))
+        assert spec.is_snowflake is False
+        spec = _parse_table_spec("mydb.T", _make_settings(mydb={"type": "snowflake"}))
+        assert spec.is_snowflake is True
+
 
 # ---------------------------------------------------------------------------
 # _build_count_query
@@ -155,6 +189,373 @@ class TestBuildCountQuery:
                 key_column="id",
             )
 
+    def test_repeated_query_is_memoized(self):
+        spec = self._spec("SCHEMA.MEMO", group_by=["a"])
+        _build_count_query(spec)
+        hits = count_module._count_query_sql.cache_info().hits
+        assert _build_count_query(spec) == "SELECT COUNT(*) FROM (SELECT 1 FROM SCHEMA.MEMO GROUP BY a)"
+        assert count_module._count_query_sql.cache_info().hits == hits + 1
+
+    def test_unsafe_identifier_rejected_every_time(self):
+        for _ in range(2):
+            with pytest.raises(SQLInjectionError):
+                _build_count_query(self._spec("T; DROP TABLE x"))
+
+
+class TestBuildMetricsQuery:
+    """Tests for the fused COUNT + SUM query."""
+
+    def _spec(self, table: str, group_by: list[str] | None = None) -> TableSpec:
+        return TableSpec(
+            raw=f"sf.{table}",
+            alias="sf",
+            table=table,
+            group_by=group_by,
+            is_snowflake=True,
+        )
+
+    def test_without_sum_is_count_query(self):
+        spec = self._spec("SCHEMA.TABLE")
+        assert _build_metrics_query(spec) == _build_count_query(spec)
+
+    def test_count_and_sum_share_one_scan(self):
+        q = _build_metrics_query(self._spec("SCHEMA.TABLE"), sum_column="qty")
+        assert q == "SELECT COUNT(*), SUM(qty) FROM SCHEMA.TABLE"
+
+    def test_distinct_key_with_sum(self):
+        q = _build_metrics_query(self._spec("T"), key_column="id", sum_column="qty")
+        assert q == "SELECT COUNT(DISTINCT id), SUM(qty) FROM T"
+
+    def test_group_by_with_sum_uses_scalar_subqueries(self):
+        q = _build_metrics_query(self._spec("T", group_by=["a"]), sum_column="qty")
+        assert q == "SELECT (SELECT COUNT(*) FROM (SELECT 1 FROM T GROUP BY a)), (SELECT SUM(qty) FROM T)"
+
+    def test_group_by_and_key_conflict(self):
+        with pytest.raises(ValueError, match="Cannot combine"):
+            _build_metrics_query(self._spec("T", group_by=["a"]), key_column="id", sum_column="qty")
+
+
+class TestPlanQueries:
+    """Tests for building per-table query plans up front."""
+
+    def test_local_plan_uses_alias_prefix(self):
+        settings = _make_settings(loc={"type": "duckdb", "path": "/tmp/x.duckdb"})
+        plan = _plan_queries(_parse_table_spec("loc.main.t", settings), settings, sum_column="qty")
+        assert plan.count_sql == "SELECT COUNT(*) FROM loc.main.t"
+        assert plan.sum_sql == "SELECT SUM(qty) FROM loc.main.t"
+        assert plan.metrics_sql == "SELECT COUNT(*), SUM(qty) FROM loc.main.t"
+        assert plan.config is None
+
+    def test_snowflake_plan_resolves_connection(self):
+        settings = _make_settings(wh={"type": "snowflake", "database": "ANALYTICS"})
+        plan = _plan_queries(_parse_table_spec("wh.S.T", settings), settings)
+        assert plan.count_sql == "SELECT COUNT(*) FROM S.T"
+        assert plan.sum_sql is None
+        assert plan.config is settings.snowflake
+        assert plan.database == "ANALYTICS"
+
+    def test_connection_profile_config_is_shared(self):
+        settings = _make_settings(
+            a={"type": "snowflake", "connection_name": "shared_count_profile"},
+            b={"type": "snowflake", "connection_name": "shared_count_profile"},
+        )
+        plans = [_plan_queries(_parse_table_spec(t, settings), settings) for t in ("a.S.T", "b.S.U")]
+        assert plans[0].config is plans[1].config
+        assert plans[0].config.connection_name == "shared_count_profile"
+
+    def test_invalid_spec_fails_before_any_query(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("loc.A", "sf.B[x]")]
+        connector = _FakeMetricsConnector()
+
+        with pytest.raises(ValueError, match="Cannot combine"):
+            _collect_direct_metrics(connector, settings, specs, "id", [None, None])
+        assert connector.local_queries == []
+
+
+class TestIsCertainMismatch:
+    """Tests for deciding that partial counts already fail the check."""
+
+    def test_single_result_is_undecided(self):
+        assert _is_certain_mismatch({0: (10, None)}) is False
+
+    def test_differing_counts_without_reference(self):
+        assert _is_certain_mismatch({1: (10, None), 2: (11, None)}) is True
+
+    def test_threshold_needs_reference(self):
+        threshold = Threshold.parse("50%")
+        assert _is_certain_mismatch({1: (10, None), 2: (100, None)}, count_threshold=threshold) is False
+
+    def test_within_threshold_of_reference(self):
+        threshold = Threshold.parse("10%")
+        assert _is_certain_mismatch({0: (100, None), 2: (95, None)}, count_threshold=threshold) is False
+        assert _is_certain_mismatch({0: (100, None), 2: (80, None)}, count_threshold=threshold) is True
+
+    def test_differing_sums(self):
+        assert _is_certain_mismatch({0: (10, 5), 1: (10, 6)}) is True
+
+
+# ---------------------------------------------------------------------------
+# _collect_direct_metrics
+# ---------------------------------------------------------------------------
+
+
+class _FakeMetricsConnector:
+    """Connector stand-in returning canned aggregates and recording threads."""
+
+    def __init__(self) -> None:
+        self.snowflake_queries: list[str] = []
+        self.local_queries: list[str] = []
+        self.snowflake_threads: set[int] = set()
+        self.local_threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def execute_snowflake_row(self, query: str, config=None, database=None) -> tuple[int, ...]:
+        with self._lock:
+            self.snowflake_queries.append(query)
+            self.snowflake_threads.add(threading.get_ident())
+        # Every table contributes one COUNT and, optionally, one SUM column
+        columns = query.count("COUNT(") + query.count("SUM(")
+        return tuple(10 + i for i in range(columns))
+
+    def execute_fetchone(self, query: str) -> tuple[int, ...]:
+        self.local_queries.append(query)
+        self.local_threads.add(threading.get_ident())
+        columns = query.count("COUNT(") + query.count("SUM(")
+        return tuple(10 + i for i in range(columns))
+
+    def execute_fetchall(self, query: str, params=None) -> list[tuple]:
+        # Every aliased table is reported as a view, so nothing is persisted
+        return []
+
+
+class TestCollectDirectMetrics:
+    """Tests for running per-table metrics, batched and concurrent for Snowflake."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_metric_cache(self, monkeypatch):
+        monkeypatch.setattr(count_module, "_metric_cache", {})
+
+    def test_snowflake_groups_run_off_main_thread(self):
+        settings = _make_settings(wh={"type": "snowflake"})
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "loc.B", "wh.C")]
+        connector = _FakeMetricsConnector()
+
+        metrics = _collect_direct_metrics(connector, settings, specs, None, [None, None, None])
+
+        assert metrics == [(10, None), (10, None), (10, None)]
+        assert threading.get_ident() not in connector.snowflake_threads
+        assert connector.local_threads == {threading.get_ident()}
+
+    def test_single_snowflake_table_runs_inline(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "loc.B")]
+        connector = _FakeMetricsConnector()
+
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+
+        assert connector.snowflake_threads == {threading.get_ident()}
+
+    def test_repeated_table_is_queried_once(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "sf.A")]
+        connector = _FakeMetricsConnector()
+
+        metrics = _collect_direct_metrics(connector, settings, specs, None, [None, None])
+
+        assert metrics == [(10, None), (10, None)]
+        assert connector.snowflake_queries == ["SELECT COUNT(*) FROM A"]
+
+    def test_repeated_uncached_table_is_queried_once(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("orders", "orders", "orders[x]")]
+        connector = _FakeMetricsConnector()
+
+        metrics = _collect_direct_metrics(connector, settings, specs, None, ["qty", "qty", None])
+
+        assert metrics == [(10, 11), (10, 11), (12, None)]
+        assert connector.local_queries == [
+            "SELECT * FROM (SELECT COUNT(*), SUM(qty) FROM orders) AS m0, "
+            "(SELECT COUNT(*) FROM (SELECT 1 FROM orders GROUP BY x)) AS m1",
+        ]
+
+    def test_results_are_reused_across_calls(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "sf.B")]
+        connector = _FakeMetricsConnector()
+
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+        assert len(connector.snowflake_queries) == 1
+
+        _collect_direct_metrics(connector, settings, specs, None, [None, None], use_cache=False)
+        assert len(connector.snowflake_queries) == 2
+
+    def test_local_results_keyed_by_file_mtime(self, tmp_path):
+        db_path = tmp_path / "x.duckdb"
+        db_path.write_bytes(b"")
+        settings = _make_settings(loc={"type": "duckdb", "path": str(db_path)})
+        specs = [_parse_table_spec("loc.t", settings), _parse_table_spec("t", settings)]
+        connector = _FakeMetricsConnector()
+
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+        # Unaliased tables are never cached
+        assert connector.local_queries == [
+            "SELECT * FROM (SELECT COUNT(*) FROM loc.t) AS m0, (SELECT COUNT(*) FROM t) AS m1",
+            "SELECT COUNT(*) FROM t",
+        ]
+        assert len(count_module._metric_cache) == 1
+
+        os.utime(db_path, (0, 0))
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+        assert len(count_module._metric_cache) == 2
+
+    def test_stop_skips_remaining_tables(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "loc.B", "loc.C")]
+        connector = _FakeMetricsConnector()
+
+        metrics = _collect_direct_metrics(
+            connector, settings, specs, None, [None, None, None], stop=lambda known: len(known) >= 1
+        )
+
+        assert metrics == [(10, None), None, None]
+        assert connector.local_queries == []
+
+    def test_stop_on_cached_results_fills_duplicates(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "sf.A", "loc.B")]
+        connector = _FakeMetricsConnector()
+        _collect_direct_metrics(connector, settings, specs[:1], None, [None])
+
+        metrics = _collect_direct_metrics(
+            connector, settings, specs, None, [None, None, None], stop=lambda known: len(known) >= 1
+        )
+
+        assert metrics == [(10, None), (10, None), None]
+        assert connector.local_queries == []
+
+    def test_stop_keeps_groups_that_already_ran(self):
+        settings = _make_settings(**{alias: {"type": "snowflake"} for alias in ("pa", "pb", "pc")})
+        specs = [_parse_table_spec(t, settings) for t in ("pa.A", "pb.B", "pc.C")]
+        connector = _FakeMetricsConnector()
+        # Every group is in flight before any of them returns
+        barrier = threading.Barrier(3)
+        original = connector.execute_snowflake_row
+
+        def execute_snowflake_row(query, config=None, database=None):
+            barrier.wait(timeout=5)
+            return original(query, config, database)
+
+        connector.execute_snowflake_row = execute_snowflake_row
+
+        metrics = _collect_direct_metrics(
+            connector, settings, specs, None, [None, None, None], stop=lambda known: len(known) >= 1
+        )
+
+        assert metrics == [(10, None), (10, None), (10, None)]
+
+    def test_same_alias_is_batched_into_one_query(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "loc.B", "sf.C[x]")]
+        connector = _FakeMetricsConnector()
+
+        metrics = _collect_direct_metrics(connector, settings, specs, None, ["qty", None, "amt"])
+
+        assert connector.snowflake_queries == [
+            "SELECT * FROM (SELECT COUNT(*), SUM(qty) FROM A) AS m0, "
+            "(SELECT (SELECT COUNT(*) FROM (SELECT 1 FROM C GROUP BY x)), (SELECT SUM(amt) FROM C)) AS m1"
+        ]
+        assert metrics[0] == (10, 11)
+        assert metrics[2] == (12, 13)
+
+
+class _DuckDBBackedSnowflake(_FakeMetricsConnector):
+    """Runs "Snowflake" queries on an in-memory DuckDB database."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.db = duckdb.connect()
+        self.db.execute("CREATE TABLE A AS SELECT range AS qty FROM range(5)")
+        self.db.execute("CREATE TABLE C AS SELECT range % 2 AS x, range AS amt FROM range(4)")
+
+    def execute_snowflake_row(self, query: str, config=None, database=None) -> tuple:
+        self.snowflake_queries.append(query)
+        return self.db.execute(query).fetchone()
+
+
+class TestSnowflakeBatch:
+    """Tests for the SQL shape of batched Snowflake metrics."""
+
+    def test_batched_query_returns_metrics_in_order(self):
+        settings = _make_settings()
+        specs = [_parse_table_spec(t, settings) for t in ("sf.A", "sf.C[x]", "sf.A")]
+        sums = ["qty", "amt", None]
+        connector = _DuckDBBackedSnowflake()
+
+        plans = [_plan_queries(spec, settings, sum_column=col) for spec, col in zip(specs, sums, strict=True)]
+        metrics = count_module._fetch_direct_metrics(connector, plans)
+
+        assert len(connector.snowflake_queries) == 1
+        assert metrics == {0: (5, 10), 1: (2, 6), 2: (5, None)}
+
+
+class TestPersistentCountCache:
+    """Tests for reusing local counts across runs via count_cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_metric_cache(self, monkeypatch):
+        monkeypatch.setattr(count_module, "_metric_cache", {})
+
+    @pytest.fixture
+    def attached(self, tmp_path):
+        db_path = tmp_path / "loc.duckdb"
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(3)")
+        conn.execute("CREATE VIEW v AS SELECT * FROM t")
+        conn.close()
+        settings = _make_settings(loc={"type": "duckdb", "path": str(db_path)})
+        connector = DuckDBConnector(database=":memory:")
+        connector.attach_duckdb("loc", str(db_path))
+        yield connector, settings
+        connector.close()
+
+    def test_base_table_counts_survive_the_process_cache(self, attached, monkeypatch):
+        connector, settings = attached
+        specs = [_parse_table_spec(t, settings) for t in ("loc.t", "loc.v[id]")]
+
+        assert _collect_direct_metrics(connector, settings, specs, None, [None, None]) == [(3, None), (3, None)]
+
+        # A fresh process: only the base table is answered without a query
+        monkeypatch.setattr(count_module, "_metric_cache", {})
+        fake = _FakeMetricsConnector()
+        metrics = _collect_direct_metrics(fake, settings, specs, None, [None, None])
+        assert metrics == [(3, None), (10, None)]
+        assert fake.local_queries == ["SELECT COUNT(*) FROM (SELECT 1 FROM loc.v GROUP BY id)"]
+
+    def test_key_tracks_the_write_ahead_log(self, tmp_path):
+        """Writes still in the .wal file change the cache key."""
+        db_path = tmp_path / "wal.duckdb"
+        db_path.write_bytes(b"")
+        settings = _make_settings(wal={"type": "duckdb", "path": str(db_path)})
+        spec = _parse_table_spec("wal.t", settings)
+        before = count_module._metric_cache_key(spec, settings, None, None)
+
+        (tmp_path / "wal.duckdb.wal").write_bytes(b"pending")
+
+        assert count_module._metric_cache_key(spec, settings, None, None) != before
+
+    def test_no_cache_skips_persistent_lookup(self, attached, monkeypatch):
+        connector, settings = attached
+        specs = [_parse_table_spec(t, settings) for t in ("loc.t", "loc.t[id]")]
+        _collect_direct_metrics(connector, settings, specs, None, [None, None])
+
+        monkeypatch.setattr(count_module, "_metric_cache", {})
+        fake = _FakeMetricsConnector()
+        _collect_direct_metrics(fake, settings, specs, None, [None, None], use_cache=False)
+        assert len(fake.local_queries) == 1
+
 
 # ---------------------------------------------------------------------------
 # CLI integration: local DuckDB group-by
@@ -242,6 +643,27 @@ class TestCountGroupByLocal:
         data = json.loads(result.output)
         assert data["status"] == "match"
 
+    def test_group_by_with_sum_column(self, temp_group_by_db):
+        """Group-by counts and whole-table sums come back from one query."""
+        result = runner.invoke(
+            app,
+            [
+                "count",
+                "-t",
+                "gb.t_dup[cat]",
+                "-t",
+                "gb.t_dup[sub]",
+                "--sum-column",
+                "id",
+                "--json",
+                "--config",
+                temp_group_by_db,
+            ],
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["status"] == "match"
+
     def test_group_by_and_key_conflict_cli(self, temp_group_by_db):
         """--key combined with [group_by] should error."""
         result = runner.invoke(
@@ -260,6 +682,72 @@ class TestCountGroupByLocal:
         )
         assert result.exit_code == 2
 
+    def test_multiple_aliases_attached(self, temp_group_by_db, tmp_path):
+        """Tables from two configured DuckDB files can be counted together."""
+        other_db = tmp_path / "other.duckdb"
+        conn = duckdb.connect(str(other_db))
+        conn.execute("CREATE TABLE t_cat AS SELECT * FROM (VALUES ('a'), ('b')) v(cat)")
+        conn.close()
+        config = Path(temp_group_by_db)
+        config.write_text(
+            config.read_text(encoding="utf-8") + f"  other:\n    type: duckdb\n    path: {other_db}\n",
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(
+            app,
+            ["count", "-t", "gb.t_dup[cat]", "-t", "other.t_cat[cat]", "--config", str(config)],
+        )
+        assert result.exit_code == 0
+
+    def test_json_mismatch_reports_every_table(self, temp_group_by_db, monkeypatch):
+        """--json disables fail-fast, so a mismatch still lists every table."""
+        stops = []
+        collect = count_module._collect_direct_metrics
+
+        def recording_collect(*args, **kwargs):
+            stops.append(kwargs.get("stop"))
+            return collect(*args, **kwargs)
+
+        monkeypatch.setattr(count_module, "_collect_direct_metrics", recording_collect)
+        result = runner.invoke(
+            app,
+            [
+                "count",
+                "-t",
+                "gb.t_plain",
+                "-t",
+                "gb.t_dup[cat]",
+                "-t",
+                "gb.t_dup[sub]",
+                "--json",
+                "--config",
+                temp_group_by_db,
+            ],
+        )
+
+        assert result.exit_code == 1
+        data = json.loads(result.output)
+        assert [t["table"] for t in data["tables"]] == ["gb.t_plain", "gb.t_dup[cat]", "gb.t_dup[sub]"]
+        assert stops == [None]
+
+    def test_local_tables_counted_in_one_query(self, temp_group_by_db):
+        """Local tables are counted together, so fail-fast has nothing to skip."""
+        args = ["count", "-t", "gb.t_plain", "-t", "gb.t_dup[cat]", "-t", "gb.t_dup[sub]", "--json"]
+        result = runner.invoke(app, [*args, "--config", temp_group_by_db])
+        assert result.exit_code == 1
+        counts = [table["count"] for table in json.loads(result.output)["tables"]]
+        assert counts == [4, 2, 2]
+
+    def test_unbalanced_brackets_cli(self, temp_group_by_db):
+        """An unterminated [group_by] is reported as a usage error."""
+        result = runner.invoke(
+            app,
+            ["count", "-t", "gb.t_plain,gb.t_dup[cat", "--config", temp_group_by_db],
+        )
+        assert result.exit_code == 2
+        assert "Unbalanced brackets" in result.output
+
 
 class TestCountLegacyPath:
     """Ensure the legacy (no group-by, no Snowflake) path still works."""
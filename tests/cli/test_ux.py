@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
+import importlib
 import json
 import re
 import tempfile
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
 import duckdb
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
+from quack_diff.cli import console as console_module
+from quack_diff.cli import output as output_module
 from quack_diff.cli.console import (
     create_progress,
     create_spinner,
     is_json_output_mode,
     set_json_output_mode,
+    status_context,
 )
 from quack_diff.cli.errors import (
     ERROR_RECOVERY_SUGGESTIONS,
+    _error_prefix_for_type,
+    error_prefix,
     get_error_info,
     get_recovery_suggestion,
 )
@@ -27,10 +37,15 @@ from quack_diff.cli.output import (
     format_attach_result_json,
     format_error_json,
     get_version,
+    print_json,
 )
+from quack_diff.core.sql_utils import DatabaseError, SQLInjectionError, TableNotFoundError
 
 runner = CliRunner()
 
+# The package re-exports the ``attach`` command function under the module's name
+attach_module = importlib.import_module("quack_diff.cli.commands.attach")
+
 # Pattern to strip ANSI escape codes from output
 ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 
@@ -130,6 +145,30 @@ class TestProgressIndicators:
         finally:
             set_json_output_mode(False)
 
+    def test_status_context_is_noop_in_json_mode(self):
+        """status_context should not create a Rich Status in JSON output mode."""
+        set_json_output_mode(True)
+        try:
+            context = status_context("Working...")
+            assert isinstance(context, contextlib.nullcontext)
+            with context:
+                pass
+        finally:
+            set_json_output_mode(False)
+
+    def test_status_context_is_noop_without_terminal(self, monkeypatch):
+        """status_context should not create a Rich Status when stderr is not a TTY."""
+        monkeypatch.setattr(console_module, "error_console", Console(stderr=True, force_terminal=False))
+        context = status_context("Working...")
+        assert isinstance(context, contextlib.nullcontext)
+
+    def test_status_context_renders_on_stderr(self, monkeypatch):
+        """The spinner stays visible when only stdout is redirected."""
+        monkeypatch.setattr(console_module, "console", Console(force_terminal=False))
+        monkeypatch.setattr(console_module, "error_console", Console(stderr=True, force_terminal=True))
+        context = status_context("Working...")
+        assert context.console is console_module.error_console
+
 
 class TestErrorRecoverySuggestions:
     """Tests for error recovery suggestion system."""
@@ -186,6 +225,31 @@ class TestErrorRecoverySuggestions:
         assert info.details == "detailed info"
 
 
+class TestErrorPrefix:
+    """Tests for error_prefix."""
+
+    def test_exact_type(self):
+        assert error_prefix(TableNotFoundError(table="t")) == "Table not found"
+
+    def test_sql_injection_before_value_error(self):
+        assert error_prefix(SQLInjectionError("bad")) == "Invalid input"
+
+    def test_subclass_falls_back_to_base(self):
+        class CustomDatabaseError(DatabaseError):
+            pass
+
+        assert error_prefix(CustomDatabaseError("boom")) == "Database error"
+
+    def test_unknown_type(self):
+        assert error_prefix(RuntimeError("boom")) == "Unexpected error"
+
+    def test_resolution_is_cached_per_type(self):
+        error_prefix(KeyError("a"))
+        hits = _error_prefix_for_type.cache_info().hits
+        error_prefix(KeyError("b"))
+        assert _error_prefix_for_type.cache_info().hits == hits + 1
+
+
 class TestJSONOutputFormatting:
     """Tests for JSON output formatting functions."""
 
@@ -230,6 +294,42 @@ class TestJSONOutputFormatting:
         assert result["meta"]["duration_seconds"] == 0.5
 
 
+class TestPrintJSON:
+    """Tests for print_json serialization."""
+
+    def test_matches_stdlib_output(self, capsys):
+        """print_json output should not depend on whether orjson is installed."""
+        data = {"when": datetime(2024, 1, 15, 10, 30), "amount": Decimal("1.50"), "rows": [{"id": 1, "v": None}]}
+
+        print_json(data)
+
+        assert capsys.readouterr().out == json.dumps(data, indent=2, default=str) + "\n"
+
+    def test_backends_agree_on_text_and_non_finite_floats(self, capsys, monkeypatch):
+        """Non-ASCII text and NaN/Inf are written the same with or without orjson."""
+
+        def payload():
+            return {"table": "café_☃", "sums": [float("nan"), float("inf"), 1.5]}
+
+        print_json(payload())
+        default_output = capsys.readouterr().out
+        monkeypatch.setattr(output_module, "orjson", None)
+        print_json(payload())
+        stdlib_output = capsys.readouterr().out
+
+        assert default_output == stdlib_output
+        assert stdlib_output.isascii()
+        assert json.loads(stdlib_output) == {"table": "café_☃", "sums": [None, None, 1.5]}
+
+    def test_stdlib_fallback(self, capsys, monkeypatch):
+        """print_json should work without orjson."""
+        monkeypatch.setattr(output_module, "orjson", None)
+
+        print_json({"value": 2**70})
+
+        assert json.loads(capsys.readouterr().out) == {"value": 2**70}
+
+
 class TestCompareDryRun:
     """Tests for compare command dry-run mode."""
 
@@ -297,6 +397,32 @@ class TestCompareDryRun:
         assert "target" in data
         assert "operations" in data
 
+    def test_dry_run_json_flags_configured_snowflake_alias(self, tmp_path):
+        """Dry run should flag a configured Snowflake alias, not just the sf. prefix."""
+        config = tmp_path / "quack-diff.yaml"
+        config.write_text("databases:\n  prod:\n    type: snowflake\n")
+        result = runner.invoke(
+            app,
+            [
+                "compare",
+                "--source",
+                "prod.SCHEMA.USERS",
+                "--target",
+                "data/users.parquet",
+                "--key",
+                "id",
+                "--config",
+                str(config),
+                "--dry-run",
+                "--json",
+            ],
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["source"]["is_snowflake"] is True
+        assert data["target"]["is_snowflake"] is False
+        assert data["operations"][0] == "Pull data from Snowflake using native connector"
+
 
 class TestCompareJSONOutput:
     """Tests for compare command JSON output."""
@@ -454,6 +580,54 @@ class TestAttachJSONOutput:
         # Tables list is present (may or may not have entries depending on how SHOW TABLES works)
         assert isinstance(data["tables"], list)
 
+    def test_json_output_lists_tables(self, temp_duckdb):
+        """Attach JSON output should list the tables of the attached database."""
+        result = runner.invoke(app, ["attach", "testdb", "--path", temp_duckdb, "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["tables"] == ["users"]
+
+    def test_json_output_all_catalogs(self, temp_duckdb):
+        """--all-catalogs should list fully qualified tables from every catalog."""
+        result = runner.invoke(app, ["attach", "testdb", "--path", temp_duckdb, "--json", "--all-catalogs"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert "testdb.main.users" in data["tables"]
+
+    def test_json_output_max_tables_truncates(self, tmp_path):
+        """--max-tables should cap the listing and flag it as truncated."""
+        db_path = tmp_path / "many.duckdb"
+        conn = duckdb.connect(str(db_path))
+        for name in ("a", "b", "c"):
+            conn.execute(f"CREATE TABLE {name} (id INTEGER)")
+        conn.close()
+
+        result = runner.invoke(app, ["attach", "many", "--path", str(db_path), "--json", "--max-tables", "2"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["tables"] == ["a", "b"]
+        assert data["truncated"] is True
+
+        result = runner.invoke(app, ["attach", "many", "--path", str(db_path), "--json", "--max-tables", "0"])
+        data = json.loads(result.output)
+        assert data["tables"] == ["a", "b", "c"]
+        assert data["truncated"] is False
+
+    def test_json_output_lists_every_table_by_default(self, tmp_path, monkeypatch):
+        """Without --max-tables, JSON output is never capped."""
+        monkeypatch.setattr(attach_module, "DEFAULT_MAX_TABLES", 1)
+        db_path = tmp_path / "many.duckdb"
+        conn = duckdb.connect(str(db_path))
+        for name in ("a", "b"):
+            conn.execute(f"CREATE TABLE {name} (id INTEGER)")
+        conn.close()
+
+        result = runner.invoke(app, ["attach", "many", "--path", str(db_path), "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["tables"] == ["a", "b"]
+        assert data["truncated"] is False
+
     def test_json_output_error(self):
         """Attach JSON output should have correct structure on error."""
         result = runner.invoke(
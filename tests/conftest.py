@@ -23,6 +23,12 @@ def reset_global_settings():
     set_json_output_mode(False)
 
 
+@pytest.fixture(autouse=True)
+def isolated_count_cache(tmp_path, monkeypatch):
+    """Point the persistent count cache at a per-test directory."""
+    monkeypatch.setenv("QUACK_DIFF_CACHE_DIR", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def duckdb_connection():
     """Create a fresh in-memory DuckDB connection."""
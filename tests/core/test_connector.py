@@ -1,5 +1,7 @@
 """Tests for the DuckDB connector module."""
 
+from decimal import Decimal
+
 import pytest
 
 from quack_diff.core.connector import DatabaseType, DuckDBConnector, create_connector
@@ -38,6 +40,31 @@ class TestDuckDBConnector:
         result = connector.execute_fetchall("SELECT * FROM test ORDER BY id")
         assert result == [(1,), (2,), (3,)]
 
+    def test_execute_iter(self, connector: DuckDBConnector):
+        """Test streaming results in batches."""
+        connector.execute("CREATE TABLE test AS SELECT range AS id FROM range(10)")
+
+        rows = connector.execute_iter("SELECT id FROM test ORDER BY id", batch_size=3)
+        assert list(rows) == [(i,) for i in range(10)]
+
+    def test_execute_fetchall_with_params(self, connector: DuckDBConnector, tmp_path):
+        """Test that parameters are bound, e.g. to filter duckdb_tables() by database."""
+        db_path = tmp_path / "params_test.duckdb"
+        import duckdb
+
+        temp_conn = duckdb.connect(str(db_path))
+        temp_conn.execute("CREATE TABLE orders (id INT)")
+        temp_conn.close()
+
+        connector.attach_duckdb("params_db", str(db_path))
+        connector.execute("CREATE TABLE local_only (id INT)")
+
+        result = connector.execute_fetchall(
+            "SELECT table_name FROM duckdb_tables() WHERE database_name = ? ORDER BY table_name",
+            ["params_db"],
+        )
+        assert result == [("orders",)]
+
     def test_get_table_schema(self, connector: DuckDBConnector):
         """Test getting table schema."""
         connector.execute("""
@@ -120,6 +147,38 @@ class TestDuckDBConnector:
         del attached["test_db"]
         assert "test_db" in connector.attached_databases
 
+    def test_is_attached(self, connector: DuckDBConnector, tmp_path):
+        """Test checking for an attached alias without copying the registry."""
+        db_path = tmp_path / "is_attached.duckdb"
+        import duckdb
+
+        duckdb.connect(str(db_path)).close()
+
+        assert connector.is_attached("probe") is False
+        connector.attach_duckdb("probe", str(db_path))
+        assert connector.is_attached("probe") is True
+        connector.detach("probe")
+        assert connector.is_attached("probe") is False
+
+    def test_attach_from_multiple_threads(self, connector: DuckDBConnector, tmp_path):
+        """Test that databases attached concurrently are all queryable."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import duckdb
+
+        names = [f"db{i}" for i in range(4)]
+        for name in names:
+            conn = duckdb.connect(str(tmp_path / f"{name}.duckdb"))
+            conn.execute(f"CREATE TABLE t AS SELECT '{name}' AS name")
+            conn.close()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda n: connector.attach_duckdb(n, str(tmp_path / f"{n}.duckdb")), names))
+
+        assert sorted(connector.attached_databases) == names
+        for name in names:
+            assert connector.execute_fetchone(f"SELECT name FROM {name}.t") == (name,)
+
 
 class TestCreateConnectorContextManager:
     """Tests for the create_connector context manager."""
@@ -228,3 +287,169 @@ class TestDatabaseErrorHandling:
         """Test execute_fetchone with non-existent table."""
         with pytest.raises((TableNotFoundError, QueryExecutionError)):
             connector.execute_fetchone("SELECT * FROM ghost_table")
+
+
+class _FakeSnowflakeCursor:
+    """Minimal stand-in for a snowflake.connector cursor."""
+
+    def __init__(self, batches: list) -> None:
+        self._batches = batches
+        self.query: str | None = None
+
+    def execute(self, query: str) -> None:
+        self.query = query
+
+    def fetch_arrow_batches(self):
+        return iter(self._batches)
+
+    def fetchone(self):
+        return _FakeSnowflakeConnection.row
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeSnowflakeConnection:
+    """Minimal stand-in for a snowflake.connector connection."""
+
+    batches: list = []
+    row: tuple | None = None
+
+    def __init__(self, **params) -> None:
+        self.params = params
+        self.closed = False
+        self.cursors: list[_FakeSnowflakeCursor] = []
+
+    def cursor(self) -> _FakeSnowflakeCursor:
+        cursor = _FakeSnowflakeCursor(self.batches)
+        self.cursors.append(cursor)
+        return cursor
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestSnowflakeSessionReuse:
+    """Tests for Snowflake session caching on the connector."""
+
+    @pytest.fixture
+    def fake_snowflake(self, monkeypatch):
+        import sys
+        import types
+
+        opened: list[_FakeSnowflakeConnection] = []
+
+        def connect(**params):
+            conn = _FakeSnowflakeConnection(**params)
+            opened.append(conn)
+            return conn
+
+        module = types.ModuleType("snowflake.connector")
+        module.connect = connect
+        package = types.ModuleType("snowflake")
+        package.connector = module
+        monkeypatch.setitem(sys.modules, "snowflake", package)
+        monkeypatch.setitem(sys.modules, "snowflake.connector", module)
+        return opened
+
+    def test_same_params_share_session(self, fake_snowflake):
+        """Test that identical connection parameters reuse one session."""
+        connector = DuckDBConnector()
+        params = {"account": "acct", "user": "u", "password": "p"}
+
+        first = connector._snowflake_session(params)
+        second = connector._snowflake_session(dict(params))
+
+        assert first is second
+        assert len(fake_snowflake) == 1
+
+    def test_different_params_open_new_session(self, fake_snowflake):
+        """Test that a different account gets its own session."""
+        connector = DuckDBConnector()
+
+        connector._snowflake_session({"account": "a", "user": "u", "password": "p"})
+        connector._snowflake_session({"account": "b", "user": "u", "password": "p"})
+
+        assert len(fake_snowflake) == 2
+
+    def test_close_closes_sessions(self, fake_snowflake):
+        """Test that closing the connector closes cached sessions."""
+        connector = DuckDBConnector()
+        session = connector._snowflake_session({"account": "a", "user": "u", "password": "p"})
+
+        connector.close()
+
+        assert session.closed is True
+        assert connector._sf_sessions == {}
+
+    def test_pull_streams_arrow_batches(self, fake_snowflake, monkeypatch):
+        """Test that pulled Arrow batches are streamed into one local table."""
+        pa = pytest.importorskip("pyarrow")
+        monkeypatch.setattr(
+            _FakeSnowflakeConnection,
+            "batches",
+            [
+                pa.table({"id": pa.array([1, 2], pa.int64()), "name": ["a", "b"]}),
+                # Later batches may come back with narrower types
+                pa.table({"id": pa.array([3], pa.int8()), "name": ["c"]}),
+            ],
+        )
+
+        with DuckDBConnector() as connector:
+            local = connector.pull_snowflake_table(
+                "SCHEMA.ORDERS", "__source_pulled", account="a", user="u", password="p"
+            )
+
+            assert local == "__source_pulled"
+            assert connector.execute_fetchall("SELECT id, name FROM __source_pulled ORDER BY id") == [
+                (1, "a"),
+                (2, "b"),
+                (3, "c"),
+            ]
+            assert fake_snowflake[0].cursors[0].query == "SELECT * FROM SCHEMA.ORDERS"
+
+    def test_pull_widens_to_later_batches(self, fake_snowflake, monkeypatch):
+        """Test that a narrow first batch does not truncate wider later batches."""
+        pa = pytest.importorskip("pyarrow")
+        monkeypatch.setattr(
+            _FakeSnowflakeConnection,
+            "batches",
+            [
+                pa.table({"id": pa.array([1], pa.int8()), "amount": pa.array([Decimal("0.1")], pa.decimal128(2, 1))}),
+                pa.table(
+                    {
+                        "id": pa.array([10**10], pa.int64()),
+                        "amount": pa.array([Decimal("1234.5")], pa.decimal128(10, 1)),
+                    }
+                ),
+            ],
+        )
+
+        with DuckDBConnector() as connector:
+            connector.pull_snowflake_table("SCHEMA.ORDERS", "__source_pulled", account="a", user="u", password="p")
+
+            rows = connector.execute_fetchall("SELECT id, amount::VARCHAR FROM __source_pulled ORDER BY id")
+            assert rows == [(1, "0.1"), (10**10, "1234.5")]
+
+    def test_execute_snowflake_row_returns_all_columns(self, fake_snowflake, monkeypatch):
+        """Test that several aggregates come back from one query."""
+        from quack_diff.config import SnowflakeConfig
+
+        monkeypatch.setattr(_FakeSnowflakeConnection, "row", (42, 7.5))
+        config = SnowflakeConfig(account="a", user="u", password="p")
+
+        with DuckDBConnector() as connector:
+            row = connector.execute_snowflake_row("SELECT COUNT(*), SUM(x) FROM T", config=config)
+
+            assert row == (42, 7.5)
+            with pytest.raises(QueryExecutionError, match="expected exactly one"):
+                connector.execute_snowflake_scalar("SELECT COUNT(*), SUM(x) FROM T", config=config)
+
+    def test_execute_snowflake_row_no_rows(self, fake_snowflake):
+        """Test that an empty result raises QueryExecutionError."""
+        from quack_diff.config import SnowflakeConfig
+
+        config = SnowflakeConfig(account="a", user="u", password="p")
+
+        with DuckDBConnector() as connector, pytest.raises(QueryExecutionError, match="no rows"):
+            connector.execute_snowflake_row("SELECT 1 WHERE FALSE", config=config)
@@ -0,0 +1,68 @@
+"""Tests for quack_diff.core.count_cache."""
+
+import sqlite3
+from decimal import Decimal
+
+from quack_diff.core import count_cache
+
+
+class TestCountCache:
+    """Tests for the persistent count cache."""
+
+    def test_cache_path_honours_override(self, tmp_path, monkeypatch):
+        """QUACK_DIFF_CACHE_DIR selects the cache directory."""
+        monkeypatch.setenv(count_cache.CACHE_DIR_ENV, str(tmp_path))
+        assert count_cache.cache_path() == tmp_path / "counts.sqlite"
+
+    def test_miss_returns_none(self):
+        """Unknown keys are not found."""
+        with count_cache.CountCache() as cache:
+            assert cache.get(("a", 1)) is None
+
+    def test_round_trip(self):
+        """Stored metrics are returned for the same key, also after reopening."""
+        with count_cache.CountCache() as cache:
+            cache.put(("a", 1), (42, 7.5))
+            assert cache.get(("a", 1)) == (42, 7.5)
+        with count_cache.CountCache() as cache:
+            assert cache.get(("a", 1)) == (42, 7.5)
+            assert cache.get(("a", 2)) is None
+
+    def test_one_connection_per_handle(self, monkeypatch):
+        """Lookups and writes through one handle share a single connection."""
+        opened = []
+        connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            opened.append(args)
+            return connect(*args, **kwargs)
+
+        monkeypatch.setattr(count_cache.sqlite3, "connect", counting_connect)
+        with count_cache.CountCache() as cache:
+            cache.get(("a", 1))
+            cache.put(("a", 1), (1, None))
+            cache.put(("a", 2), (2, None))
+            cache.get(("a", 2))
+        assert len(opened) == 1
+
+    def test_unused_handle_does_not_open_database(self, tmp_path, monkeypatch):
+        """The cache file is only created once it is used."""
+        monkeypatch.setenv(count_cache.CACHE_DIR_ENV, str(tmp_path / "cache"))
+        with count_cache.CountCache():
+            pass
+        assert not (tmp_path / "cache").exists()
+
+    def test_unserializable_sum_not_stored(self):
+        """Sums that do not survive JSON are skipped."""
+        with count_cache.CountCache() as cache:
+            cache.put(("a", 1), (42, Decimal("1.5")))
+            assert cache.get(("a", 1)) is None
+
+    def test_unavailable_directory_is_ignored(self, tmp_path, monkeypatch):
+        """A cache directory that cannot be created disables the cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv(count_cache.CACHE_DIR_ENV, str(blocker / "sub"))
+        with count_cache.CountCache() as cache:
+            cache.put(("a", 1), (1, None))
+            assert cache.get(("a", 1)) is None
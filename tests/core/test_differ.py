@@ -11,6 +11,7 @@ from quack_diff.core.differ import (
     DiffType,
     SchemaComparisonResult,
     TableCount,
+    Threshold,
 )
 from quack_diff.core.sql_utils import KeyColumnError, SchemaError, TableNotFoundError
 
@@ -234,6 +235,30 @@ class TestDataDiffer:
         assert not result.is_match
         assert [tc.count for tc in result.table_counts] == [3, 3, 2]
 
+    def test_count_check_uses_one_query(self, connector: DuckDBConnector, monkeypatch):
+        """Test count_check counts several tables with a single query."""
+        connector.execute("CREATE TABLE t1 AS SELECT * FROM range(3)")
+        connector.execute("CREATE TABLE t2 AS SELECT * FROM range(4)")
+        queries: list[str] = []
+        original = connector.execute_fetchone
+
+        def spy(query, params=None):
+            queries.append(query)
+            return original(query, params)
+
+        monkeypatch.setattr(connector, "execute_fetchone", spy)
+        result = DataDiffer(connector).count_check(tables=["t1", "t2"], key_column=None)
+
+        assert [tc.count for tc in result.table_counts] == [3, 4]
+        assert len(queries) == 1
+
+    def test_count_check_missing_table_named(self, connector: DuckDBConnector):
+        """Test a missing table is reported by name despite the combined query."""
+        connector.execute("CREATE TABLE t1 (id INT)")
+
+        with pytest.raises(TableNotFoundError, match="ghost_count"):
+            DataDiffer(connector).count_check(tables=["t1", "ghost_count"], key_column=None)
+
     def test_count_check_distinct_key(self, identical_tables: DuckDBConnector):
         """Test count_check with COUNT(DISTINCT key)."""
         differ = DataDiffer(identical_tables)
@@ -305,6 +330,23 @@ class TestCountResult:
         result = CountResult(table_counts=[], key_column=None, is_match=True)
         assert result.expected_count is None
 
+    def test_metrics_match_compares_counts_and_sums(self):
+        """Test metrics_match requires equal counts and equal sums."""
+        assert CountResult(table_counts=[TableCount("a", 10), TableCount("b", 10)]).metrics_match is True
+        assert CountResult(table_counts=[TableCount("a", 10), TableCount("b", 11)]).metrics_match is False
+        result = CountResult(table_counts=[TableCount("a", 10, sum_value=5), TableCount("b", 10, sum_value=6)])
+        assert result.metrics_match is False
+
+    def test_within_threshold_uses_tolerances(self):
+        """Test within_threshold falls back to the configured thresholds."""
+        result = CountResult(
+            table_counts=[TableCount("a", 100, sum_value=50.0), TableCount("b", 99, sum_value=51.0)],
+            count_threshold=Threshold.parse("1%"),
+        )
+        assert result.within_threshold is False
+        result.sum_threshold = Threshold.parse("5%")
+        assert result.within_threshold is True
+
 
 class TestDiffResult:
     """Tests for DiffResult dataclass."""
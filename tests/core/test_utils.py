@@ -69,6 +69,7 @@ class TestParseOffsetToSeconds:
         """Extra whitespace is handled."""
         assert parse_offset_to_seconds("  5 minutes  ") == 300
         assert parse_offset_to_seconds("5  minutes") == 300
+        assert parse_offset_to_seconds("5 minutes   ago") == 300
 
     def test_invalid_format_no_number(self):
         """String without number raises ValueError."""
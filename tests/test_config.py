@@ -0,0 +1,118 @@
+"""Tests for quack_diff.config module."""
+
+from __future__ import annotations
+
+import os
+
+from quack_diff.config import _cached_get_settings, _parse_yaml_config, get_settings, get_snowflake_config
+
+
+class TestGetSettingsCache:
+    """Tests for get_settings memoization by config file."""
+
+    def test_same_config_file_returns_cached_settings(self, tmp_path):
+        """Repeated calls with an unchanged config file reuse the parsed settings."""
+        config_path = tmp_path / "quack-diff.yaml"
+        config_path.write_text("defaults:\n  threshold: 0.05\n", encoding="utf-8")
+
+        first = get_settings(config_file=config_path)
+        second = get_settings(config_file=config_path)
+
+        assert first == second
+        assert first.defaults.threshold == 0.05
+        assert _cached_get_settings.cache_info().hits == 1
+
+    def test_cached_settings_are_not_shared(self, tmp_path):
+        """Callers get independent copies of the cached settings."""
+        config_path = tmp_path / "quack-diff.yaml"
+        config_path.write_text("defaults:\n  threshold: 0.05\n", encoding="utf-8")
+
+        first = get_settings(config_file=config_path)
+        first.defaults.threshold = 0.5
+        second = get_settings(config_file=config_path)
+
+        assert first is not second
+        assert second.defaults.threshold == 0.05
+
+    def test_changed_environment_is_reloaded(self, tmp_path, monkeypatch):
+        """Changing a QUACK_DIFF_* variable invalidates the cached settings."""
+        config_path = tmp_path / "quack-diff.yaml"
+        config_path.write_text("defaults:\n  threshold: 0.05\n", encoding="utf-8")
+        monkeypatch.delenv("QUACK_DIFF_VERBOSE", raising=False)
+        assert get_settings(config_file=config_path).verbose is False
+
+        monkeypatch.setenv("QUACK_DIFF_VERBOSE", "true")
+
+        assert get_settings(config_file=config_path).verbose is True
+
+    def test_modified_config_file_is_reloaded(self, tmp_path):
+        """Changing the config file mtime invalidates the cached settings."""
+        config_path = tmp_path / "quack-diff.yaml"
+        config_path.write_text("defaults:\n  threshold: 0.05\n", encoding="utf-8")
+        first = get_settings(config_file=config_path)
+
+        config_path.write_text("defaults:\n  threshold: 0.1\n", encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, (stat.st_atime, stat.st_mtime + 10))
+        second = get_settings(config_file=config_path)
+
+        assert first is not second
+        assert second.defaults.threshold == 0.1
+
+    def test_overrides_reuse_parsed_yaml(self, tmp_path):
+        """Settings built with overrides still parse an unchanged file once."""
+        config_path = tmp_path / "quack-diff.yaml"
+        config_path.write_text("defaults:\n  threshold: 0.05\n", encoding="utf-8")
+
+        first = get_settings(config_file=config_path, verbose=True)
+        second = get_settings(config_file=config_path, verbose=True)
+
+        assert first is not second
+        assert second.defaults.threshold == 0.05
+        assert _parse_yaml_config.cache_info().misses == 1
+
+
+class TestGetSnowflakeConfig:
+    """Tests for get_snowflake_config memoization by profile."""
+
+    @staticmethod
+    def _write_connections(path, account):
+        path.write_text(f'[connections.prod]\naccount = "{account}"\nuser = "u"\n', encoding="utf-8")
+
+    def test_profile_is_loaded_once_and_copied(self, tmp_path, monkeypatch):
+        """Repeated lookups reuse the parsed profile but return independent copies."""
+        connections = tmp_path / "connections.toml"
+        self._write_connections(connections, "acct1")
+        monkeypatch.setenv("QUACK_DIFF_SNOWFLAKE_CONNECTIONS_FILE", str(connections))
+
+        first = get_snowflake_config("prod")
+        first.account = "changed"
+        second = get_snowflake_config("prod")
+
+        assert second.account == "acct1"
+        assert first is not second
+
+    def test_modified_connections_file_is_reloaded(self, tmp_path, monkeypatch):
+        """Editing connections.toml invalidates the cached profile."""
+        connections = tmp_path / "connections.toml"
+        self._write_connections(connections, "acct1")
+        monkeypatch.setenv("QUACK_DIFF_SNOWFLAKE_CONNECTIONS_FILE", str(connections))
+        assert get_snowflake_config("prod").account == "acct1"
+
+        self._write_connections(connections, "acct22")
+        stat = connections.stat()
+        os.utime(connections, (stat.st_atime, stat.st_mtime + 10))
+
+        assert get_snowflake_config("prod").account == "acct22"
+
+    def test_changed_environment_is_reloaded(self, tmp_path, monkeypatch):
+        """Changing a QUACK_DIFF_SNOWFLAKE_* variable invalidates the cached profile."""
+        connections = tmp_path / "connections.toml"
+        self._write_connections(connections, "acct1")
+        monkeypatch.setenv("QUACK_DIFF_SNOWFLAKE_CONNECTIONS_FILE", str(connections))
+        monkeypatch.delenv("QUACK_DIFF_SNOWFLAKE_WAREHOUSE", raising=False)
+        assert get_snowflake_config("prod").warehouse is None
+
+        monkeypatch.setenv("QUACK_DIFF_SNOWFLAKE_WAREHOUSE", "WH")
+
+        assert get_snowflake_config("prod").warehouse == "WH"
@@ -0,0 +1,40 @@
+"""Tests for the top-level package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import quack_diff
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package exports."""
+
+    def test_import_does_not_load_duckdb(self):
+        """Test that importing the package defers the DuckDB import."""
+        code = "import sys, quack_diff, quack_diff.core.sql_utils; print('duckdb' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_cli_import_does_not_load_duckdb(self):
+        """Test that loading the CLI (as --help and --dry-run do) defers the DuckDB import."""
+        code = (
+            "import sys, quack_diff.cli.main; "
+            "print('duckdb' in sys.modules, 'quack_diff.core.connector' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False False"
+
+    def test_lazy_exports_resolve(self):
+        """Test that lazy exports resolve to the real classes."""
+        from quack_diff.core.connector import DuckDBConnector
+        from quack_diff.core.differ import DataDiffer
+
+        assert quack_diff.DuckDBConnector is DuckDBConnector
+        assert quack_diff.DataDiffer is DataDiffer
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = quack_diff.NotAnExport